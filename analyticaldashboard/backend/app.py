@@ -1,5 +1,12 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, has_request_context, jsonify, request, stream_with_context
+from flask_caching import Cache
 from flask_cors import CORS
+import bisect
+import functools
+import hashlib
+import heapq
+import operator
+import itertools
 import os
 import logging
 from datetime import datetime, timedelta
@@ -8,10 +15,14 @@ import random
 import json
 from urllib.parse import urlparse, parse_qs
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import csv
 import io
+import threading
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import time
 import numpy as np
 from googleapiclient.discovery import build
@@ -21,6 +32,15 @@ from nltk.sentiment import SentimentIntensityAnalyzer
 from dotenv import load_dotenv
 from config import config
 
+# orjson is a drop-in C-extension JSON encoder, 3-5x faster on the deep
+# dashboard payloads; fall back to Flask's stdlib encoder without it.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 # Download VADER lexicon if not already present
 try:
@@ -34,6 +54,80 @@ try:
 except ImportError:
     SENTIMENT_AVAILABLE = False
 
+# re2 is optional: Google RE2 matches in guaranteed linear time, which
+# hardens the comment-preprocessing regexes against adversarial input.
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+# Numba is optional: when available the scoring kernel compiles to native
+# code, otherwise it runs as plain Python with identical results.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+# Single shared VADER instance. Constructing an analyzer re-parses the
+# multi-MB lexicon from disk, so every consumer reuses this one.
+_SIA = SentimentIntensityAnalyzer() if SENTIMENT_AVAILABLE else None
+
+
+# VADER scoring is pure-Python CPU work, so large batches are sharded
+# across worker processes. Below this size the fork/IPC overhead is not
+# worth it and serial scoring wins.
+_PARALLEL_SCORE_THRESHOLD = 50
+_score_pool = None
+_score_pool_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=100_000)
+def _cached_polarity(text: str) -> tuple:
+    """Polarity scores keyed by comment text
+
+    Comments on popular videos repeat verbatim ("great video!"), so
+    duplicates become an O(1) lookup. Returns (neg, neu, pos, compound)
+    as a tuple since dicts are not hashable cache values.
+    """
+    scores = _SIA.polarity_scores(text)
+    return (scores['neg'], scores['neu'], scores['pos'], scores['compound'])
+
+
+def _get_score_pool() -> ProcessPoolExecutor:
+    global _score_pool
+    if _score_pool is None:
+        with _score_pool_lock:
+            if _score_pool is None:
+                _score_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _score_pool
+
+
+def _score_polarities(texts: List[str]) -> List[tuple]:
+    """Full polarity tuples for a batch of preprocessed texts.
+
+    Batches above _PARALLEL_SCORE_THRESHOLD are spread across CPU
+    cores; each comment keeps its whole (neg, neu, pos, compound)
+    tuple for the per-comment payloads.
+    """
+    if len(texts) >= _PARALLEL_SCORE_THRESHOLD:
+        try:
+            chunksize = max(1, len(texts) // (4 * (os.cpu_count() or 1)))
+            return list(_get_score_pool().map(_cached_polarity, texts, chunksize=chunksize))
+        except Exception as e:
+            logger.warning(f"Parallel sentiment scoring failed, using serial path: {e}")
+
+    return [_cached_polarity(text) for text in texts]
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -49,6 +143,466 @@ app.config.from_object(config[config_name])
 # Configure CORS to allow all origins during development
 CORS(app, origins="*", supports_credentials=False)
 
+# Response cache backed by the CACHE_TYPE / CACHE_DEFAULT_TIMEOUT
+# settings that config.py already declares
+cache = Cache(app)
+
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson
+
+        Makes jsonify() and request.get_json() go through orjson, which
+        also serializes NumPy scalars/arrays natively.
+        """
+
+        def dumps(self, obj: Any, **kwargs) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        def loads(self, s, **kwargs) -> Any:
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+
+# Fast path for parsing LLM JSON blobs; stdlib json when orjson is absent.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response directly, bypassing jsonify.
+
+    With orjson the payload is serialized straight to bytes — no str
+    round-trip through the provider — which matters for the large
+    overview and per-comment sentiment payloads.
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(obj)
+    return Response(body, status=status, mimetype='application/json')
+
+
+# Timestamps in payloads only need second resolution, so the formatted
+# string is rebuilt at most once per second instead of per call —
+# datetime.now() costs a syscall plus formatting every time.
+_TS_CACHE = {"t": 0, "s": ""}
+
+
+def _second_iso() -> str:
+    t = int(time.time())
+    if t != _TS_CACHE["t"]:
+        _TS_CACHE["t"] = t
+        _TS_CACHE["s"] = datetime.fromtimestamp(t).isoformat()
+    return _TS_CACHE["s"]
+
+
+@app.before_request
+def _stamp_request():
+    # One timestamp per request, so every section of a response agrees
+    # on the same lastUpdated value.
+    g.now_iso = _second_iso()
+
+
+def _now_iso() -> str:
+    """Timestamp of the current request, or the cached clock outside one."""
+    if has_request_context():
+        return g.now_iso
+    return _second_iso()
+
+
+def safe_endpoint(msg: str):
+    """Wrap a route so unexpected failures log once and return a 500
+
+    Keeps the shared try/except boilerplate out of every handler;
+    routes with a bespoke fallback keep their own handling.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{msg}: {str(e)}")
+                return jsonify({"error": msg}), 500
+        return wrapper
+    return decorator
+
+
+class TTLCache:
+    """Thread-safe in-memory cache with per-entry time-to-live"""
+
+    def __init__(self):
+        self._store = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.time() >= expires_at:
+                del self._store[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._store[key] = (value, time.time() + ttl)
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+
+
+# Pre-compiled patterns for the hot parsing paths. Compiling once at import
+# avoids the per-call regex cache lookup inside loops over every video.
+# All supported channel URL formats folded into one alternation so the
+# URL is scanned once instead of once per format.
+_CHANNEL_URL_RE = re.compile(
+    r'youtube\.com/(?:'
+    r'@(?P<handle>[^/\s?]+)'                                  # Handle @username format
+    r'|channel/(?P<channel>[^/\s?]+)'                         # Channel ID format
+    r'|c/(?P<custom>[^/\s?]+)'                                # Custom URL format
+    r'|user/(?P<user>[^/\s?]+)'                               # User format
+    r'|watch\?.*v=.*&.*channel_id=(?P<video_channel>[^&\s]+)' # Video with channel_id
+    r')'
+)
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+# Comment preprocessing patterns, compiled once. The URL pattern is a
+# simple non-backtracking form; the original character-class alternation
+# could backtrack pathologically on adversarial comment text. When re2 is
+# installed the URL pattern is compiled to a DFA for linear-time matching
+# on user-submitted comment text.
+_WS_RE = re.compile(r'\s+')
+_URL_RE = (re2 if RE2_AVAILABLE else re).compile(r'https?://\S+')
+_BANG_RE = re.compile(r'!{2,}')
+_QMARK_RE = re.compile(r'\?{2,}')
+
+# Shared PCG64 generator; drawing N samples at once amortizes the
+# per-call overhead that random.uniform pays inside loops.
+_RNG = np.random.default_rng()
+
+# Shared HTTP session for all outbound requests (Gemini etc.): connection
+# pooling and keep-alive skip the per-call TLS handshake, and transient
+# errors retry with exponential backoff.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'GET', 'POST'})
+    )
+))
+atexit.register(_SESSION.close)
+
+# Piecewise-linear scoring curves for calculate_performance_score. Each
+# curve maps a raw metric through its (average, good, excellent) industry
+# benchmark breakpoints onto a 0-100 score with a single np.interp call,
+# replacing the equivalent if/elif ladder. Values beyond the last
+# breakpoint clamp at 100.
+_VIEW_RATE_CURVE = (np.array([0.0, 0.01, 0.02, 0.05, 0.10]),
+                    np.array([0.0, 40.0, 70.0, 95.0, 100.0]))
+_CTR_CURVE = (np.array([0.0, 2.0, 4.0, 10.0, 20.0]),
+              np.array([0.0, 50.0, 75.0, 95.0, 100.0]))
+_ENGAGEMENT_CURVE = (np.array([0.0, 2.0, 4.0, 8.0, 18.0]),
+                     np.array([0.0, 50.0, 75.0, 95.0, 100.0]))
+_RETENTION_CURVE = (np.array([0.0, 30.0, 50.0, 70.0, 120.0]),
+                    np.array([0.0, 50.0, 75.0, 95.0, 100.0]))
+
+# Metric weights by channel maturity, ordered as
+# (views, engagement_rate, watch_time, click_through_rate). The weighted
+# performance score is a single dot product against one of these.
+# Grade lookup table: _GRADE_LABELS[bisect_right(_GRADE_CUTOFFS, score)]
+# replaces an 11-branch if/elif ladder with one binary search.
+_GRADE_CUTOFFS = [40, 50, 55, 60, 65, 70, 75, 80, 85, 90]
+_GRADE_LABELS = ["F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
+
+# Action-item lists are static per recommendation; shared tuples avoid
+# rebuilding ~40 list objects on every recommendations call. jsonify
+# serializes tuples identically to lists.
+_ACTIONS_LOW_VIEWS = (
+    "A/B test thumbnail designs",
+    "Analyze competitor titles",
+    "Post when your audience is most active",
+    "Engage with comments within first hour",
+)
+_ACTIONS_RETENTION = (
+    "Hook viewers in first 15 seconds",
+    "Remove slow/boring sections",
+    "Add pattern interrupts every 30 seconds",
+    "Use jump cuts and visual variety",
+)
+_ACTIONS_CTR = (
+    "Use bright, contrasting colors in thumbnails",
+    "Include emotional expressions in thumbnails",
+    "Write curiosity-driven titles",
+    "Test different thumbnail styles",
+)
+_ACTIONS_ENGAGEMENT = (
+    "Ask specific questions to encourage comments",
+    "Create polls and community posts",
+    "Respond to comments quickly",
+    "End videos with clear call-to-action",
+)
+_ACTIONS_CTR_SUCCESS = (
+    "Document successful thumbnail elements",
+    "Analyze title structure for patterns",
+    "Create template based on this success",
+    "Share insights with team/community",
+)
+_ACTIONS_ENGAGEMENT_SUCCESS = (
+    "Create similar content themes",
+    "Analyze what topics drove engagement",
+    "Consider making this a series",
+    "Promote this video across platforms",
+)
+_ACTIONS_NEW_CHANNEL = (
+    "Post consistently (same days/times)",
+    "Focus on one main topic/niche",
+    "Engage actively with similar channels",
+    "Create eye-catching channel art",
+)
+_ACTIONS_MATURE_CHANNEL = (
+    "Update thumbnails on top-performing videos",
+    "Create playlists to increase session time",
+    "Experiment with new content formats",
+    "Consider collaborations with other creators",
+)
+_ACTIONS_VIRAL = (
+    "Promote heavily across all social platforms",
+    "Create follow-up content quickly",
+    "Engage with all comments to boost algorithm",
+    "Consider paid promotion to amplify reach",
+)
+
+# Display names for trend metrics, hoisted so the trends loop does not
+# rebuild the mapping on every iteration.
+_METRIC_DISPLAY = {
+    "views": "Views",
+    "engagement": "Engagement",
+    "watchTime": "Watch Time",
+    "ctr": "Click-Through Rate",
+}
+
+# Recommendation ordering: priority dominates, impact breaks ties. Each
+# recommendation carries a precomputed integer "_rank" so sorting needs
+# neither a lambda nor per-comparison dict lookups.
+_PRIO = {"high": 3, "medium": 2, "low": 1}
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """One recommendation card
+
+    Slotted instances are cheaper to allocate than 9-key dicts; they are
+    converted back to plain dicts only at the serialization boundary so
+    the JSON payload shape is unchanged.
+    """
+    id: int
+    type: str
+    title: str
+    description: str
+    priority: str
+    impact: str
+    _rank: int
+    category: str
+    actionItems: tuple
+
+_WEIGHTS_MATURE = np.array([0.20, 0.35, 0.30, 0.15], dtype=np.float32)
+_WEIGHTS_GROWING = np.array([0.25, 0.30, 0.25, 0.20], dtype=np.float32)
+_WEIGHTS_NEW = np.array([0.30, 0.25, 0.25, 0.20], dtype=np.float32)
+
+
+@njit(cache=True)
+def _score_kernel(views: float, subscribers: float, ctr: float,
+                  engagement_rate: float, retention_pct: float,
+                  video_count: float):
+    """Numeric core of calculate_performance_score
+
+    Pure float math over the benchmark curves and maturity weights so it
+    can be JIT-compiled; the Python wrapper handles dict assembly. Returns
+    (views_score, ctr_score, engagement_score, watch_time_score,
+    maturity_factor, consistency_bonus, viral_bonus, final_score).
+    """
+    # Individual metric scores along the benchmark curves
+    if subscribers > 0:
+        view_rate = views / subscribers
+        views_score = np.interp(view_rate, _VIEW_RATE_CURVE[0], _VIEW_RATE_CURVE[1])
+    else:
+        # Fallback for channels without subscriber data
+        views_score = min(100.0, (views / 100000.0) * 80.0)
+
+    ctr_score = np.interp(ctr, _CTR_CURVE[0], _CTR_CURVE[1])
+    engagement_score = np.interp(engagement_rate, _ENGAGEMENT_CURVE[0], _ENGAGEMENT_CURVE[1])
+    watch_time_score = np.interp(retention_pct, _RETENTION_CURVE[0], _RETENTION_CURVE[1])
+
+    # Dynamic weights that adjust based on channel maturity: mature
+    # channels weight engagement/retention higher, new channels views
+    maturity_factor = min(1.0, video_count / 100.0)  # Mature channels have 100+ videos
+    if maturity_factor > 0.8:
+        weights = _WEIGHTS_MATURE
+    elif maturity_factor > 0.4:
+        weights = _WEIGHTS_GROWING
+    else:
+        weights = _WEIGHTS_NEW
+
+    performance_score = (views_score * weights[0] +
+                         engagement_score * weights[1] +
+                         watch_time_score * weights[2] +
+                         ctr_score * weights[3])
+
+    # Consistency bonus (if channel has good historical performance)
+    consistency_bonus = min(5.0, maturity_factor * 5.0)
+
+    # Viral content bonus (if views significantly exceed subscriber base)
+    viral_bonus = 0.0
+    if subscribers > 0:
+        viral_ratio = views / subscribers
+        if viral_ratio > 0.1:  # 10% of subscribers is viral
+            viral_bonus = min(10.0, (viral_ratio - 0.1) * 20.0)
+
+    final_score = min(100.0, performance_score + consistency_bonus + viral_bonus)
+
+    return (views_score, ctr_score, engagement_score, watch_time_score,
+            maturity_factor, consistency_bonus, viral_bonus, final_score)
+
+
+if NUMBA_AVAILABLE:
+    # Compile eagerly at import: the first request does not pay the JIT
+    # cost, and a kernel that fails to type fails at startup instead of
+    # turning /api/overview into a 500 under load.
+    _score_kernel(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Shared cache for YouTube API responses. Channel/video data changes on the
+# order of hours, so repeated dashboard loads should not re-hit the API.
+_youtube_cache = TTLCache()
+CHANNEL_INFO_TTL = 3600   # seconds
+CHANNEL_VIDEOS_TTL = 900
+VIDEO_COMMENTS_TTL = 86400
+
+# Gemini responses keyed by sha256(model endpoint, temperature, prompt):
+# identical prompts yield interchangeable analyses, so repeat batches
+# skip the HTTP round-trip (and its 30s timeout budget) entirely.
+_gemini_cache = TTLCache()
+GEMINI_CACHE_TTL = 3600
+
+
+def _gemini_cache_key(model: str, temperature: float, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\x00{temperature}\x00{prompt}".encode()).hexdigest()
+
+
+# Per-comment sentiment cache keyed on normalized text. Comment sections
+# are full of near-duplicates ("great video!", "Great vid!!"); collapsing
+# case, punctuation and whitespace answers those locally instead of
+# spending an LLM call on each variant.
+_llm_sentiment_cache = TTLCache()
+_NORM_RE = re.compile(r'[^a-z0-9 ]+')
+
+# VADER's emoticon handling degrades quadratically on long runs of
+# repeated punctuation; collapse such runs and cap length before scoring.
+_REPEAT_RUN_RE = re.compile(r'(\W)\1{4,}')
+
+# C-level comment cleaning for prompt embedding: escape quotes, flatten
+# newlines. One translate call replaces a chain of .replace passes.
+_PROMPT_CLEAN = str.maketrans({'"': '\\"', '\n': ' ', '\r': ' '})
+
+# Newline flattening for CSV cells in one C-level pass; unlike
+# _PROMPT_CLEAN this leaves quotes alone — csv.writer escapes those.
+_CSV_CLEAN = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Markdown code fences around otherwise-clean JSON output; a single sub
+# strips both ends instead of two full find/rfind scans plus a slice.
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Schema-constrained Gemini output: the model is forced to emit exactly
+# this array shape, so responses parse directly without bracket scanning
+# and the VADER fallback stops firing on prose-wrapped JSON.
+_SENTIMENT_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "comment_id": {"type": "STRING"},
+            "sentiment": {"type": "STRING", "enum": ["positive", "negative", "neutral"]},
+            "confidence": {"type": "NUMBER"}
+        },
+        "required": ["comment_id", "sentiment", "confidence"]
+    }
+}
+
+
+def _normalize_comment(text: str) -> str:
+    return _NORM_RE.sub('', _WS_RE.sub(' ', text.strip().lower()))
+
+
+# Assembled /api/overview payload. Nothing it reads changes between
+# YouTube data refreshes, so repeated dashboard polls within the TTL
+# are served straight from the cache; update_channel_data invalidates.
+_overview_cache = TTLCache()
+OVERVIEW_TTL = 60
+
+# Serialized likes/dislikes payload, valid for one data_version; the
+# dashboard polls this endpoint every few seconds.
+_ld_cache = {"version": None, "payload": None}
+
+# Transient 429/5xx responses are retried by googleapiclient with
+# exponential backoff instead of failing the whole dashboard request.
+YOUTUBE_API_RETRIES = 3
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared across API worker threads
+
+    Callers block only when the bucket is empty, so bursts are allowed up
+    to `capacity` and sustained throughput is capped at `rate` units per
+    second — no fixed sleeps wasting time under light load, no 429 storms
+    under heavy load.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, units: float = 1.0):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= units:
+                    self._tokens -= units
+                    return
+                wait = (units - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Quota units for list endpoints cost 1 each; allow a burst of 100 with
+# ~5 units/s sustained, comfortably inside the per-minute quota.
+_youtube_bucket = TokenBucket(rate=5.0, capacity=100.0)
+
+# Gemini generateContent calls: allow a small burst, sustain ~2 req/s so
+# concurrent batch workers stay inside the per-minute quota.
+_gemini_bucket = TokenBucket(rate=2.0, capacity=8.0)
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_BATCH_WORKERS = 8
+
+# Most of a batch request's wall time is RTT, not token generation, so
+# batches are large; the token budget (~4 chars/token heuristic) splits
+# pathological batches of very long comments.
+GEMINI_BATCH_SIZE = 50
+GEMINI_BATCH_TOKEN_BUDGET = 6000
+
+
 class YouTubeAPI:
     """YouTube API wrapper for fetching channel and video data"""
     
@@ -68,30 +622,25 @@ class YouTubeAPI:
     
     def extract_channel_id_from_url(self, url: str) -> str:
         """Extract channel ID from various YouTube URL formats"""
-        patterns = [
-            r'youtube\.com/@([^/\s?]+)',  # Handle @username format
-            r'youtube\.com/channel/([^/\s?]+)',  # Channel ID format
-            r'youtube\.com/c/([^/\s?]+)',  # Custom URL format
-            r'youtube\.com/user/([^/\s?]+)',  # User format
-            r'youtube\.com/watch\?.*v=.*&.*channel_id=([^&\s]+)',  # Video with channel_id
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                extracted = match.group(1)
-                # If it's a handle pattern, add @ prefix
-                if pattern.startswith(r'youtube\.com/@'):
-                    return f"@{extracted}"
-                return extracted
-        
-        return None
+        match = _CHANNEL_URL_RE.search(url)
+        if not match:
+            return None
+
+        # Exactly one alternative matches; handles keep their @ prefix
+        if match.group('handle'):
+            return f"@{match.group('handle')}"
+        return match.group(match.lastgroup)
     
     def get_channel_info(self, channel_url: str) -> Dict[str, Any]:
         """Get channel information from YouTube URL"""
         if not self.youtube:
             return self._get_mock_channel_data()
-        
+
+        cache_key = f"yt:channel_info:{channel_url}"
+        cached = _youtube_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             channel_id = self.extract_channel_id_from_url(channel_url)
             if not channel_id:
@@ -99,19 +648,21 @@ class YouTubeAPI:
             
             logger.info(f"Fetching channel info for ID: {channel_id}")
             
+            _youtube_bucket.acquire()
+
             # Check if it's a handle (starts with @)
             if channel_id.startswith('@'):
                 # Use forHandle parameter for YouTube handles
                 channel_response = self.youtube.channels().list(
-                    part='snippet,statistics,brandingSettings',
+                    part='snippet,statistics',
                     forHandle=channel_id
-                ).execute()
+                ).execute(num_retries=YOUTUBE_API_RETRIES)
             else:
                 # Use id parameter for channel IDs
                 channel_response = self.youtube.channels().list(
-                    part='snippet,statistics,brandingSettings',
+                    part='snippet,statistics',
                     id=channel_id
-                ).execute()
+                ).execute(num_retries=YOUTUBE_API_RETRIES)
             
             # Debug: Log the response structure
             logger.info(f"API Response keys: {list(channel_response.keys())}")
@@ -128,7 +679,7 @@ class YouTubeAPI:
             snippet = channel['snippet']
             statistics = channel.get('statistics', {})
             
-            return {
+            channel_info = {
                 "channelId": channel['id'],  # Use the actual channel ID from response
                 "title": snippet['title'],
                 "description": snippet.get('description', ''),
@@ -149,7 +700,9 @@ class YouTubeAPI:
                 "topicCategories": snippet.get('topicCategories', []),
                 "topicIds": snippet.get('topicIds', [])
             }
-            
+            _youtube_cache.set(cache_key, channel_info, CHANNEL_INFO_TTL)
+            return channel_info
+
         except Exception as e:
             logger.error(f"Error fetching channel info: {e}")
             logger.error(f"Exception type: {type(e)}")
@@ -161,43 +714,62 @@ class YouTubeAPI:
         """Get recent videos from a channel"""
         if not self.youtube:
             return self._get_mock_videos_data()
-        
+
+        cache_key = f"yt:channel_videos:{channel_id}:{max_results}"
+        cached = _youtube_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             logger.info(f"Fetching videos for channel: {channel_id}")
             
             # Get channel's uploads playlist
+            _youtube_bucket.acquire()
             channel_response = self.youtube.channels().list(
                 part='contentDetails',
                 id=channel_id
-            ).execute()
+            ).execute(num_retries=YOUTUBE_API_RETRIES)
             
             if not channel_response['items']:
                 return []
             
             uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
-            # Get videos from uploads playlist
-            playlist_response = self.youtube.playlistItems().list(
+            # Stream videos from the uploads playlist; pagination is lazy,
+            # so only as many pages as max_results needs are fetched
+            playlist_request = self.youtube.playlistItems().list(
                 part='snippet,contentDetails',
                 playlistId=uploads_playlist_id,
-                maxResults=max_results
-            ).execute()
-            
+                maxResults=min(max_results, 50)
+            )
+            playlist_items = list(itertools.islice(self._paginate(playlist_request), max_results))
+
+            # Fetch statistics in batched calls (videos.list accepts up to
+            # 50 comma-separated IDs)
+            video_ids = [item['contentDetails']['videoId'] for item in playlist_items]
+            if not video_ids:
+                return []
+
+            stats_by_id = {}
+            for batch_start in range(0, len(video_ids), 50):
+                _youtube_bucket.acquire()
+                video_response = self.youtube.videos().list(
+                    part='statistics,contentDetails',
+                    id=','.join(video_ids[batch_start:batch_start + 50]),
+                    maxResults=50
+                ).execute(num_retries=YOUTUBE_API_RETRIES)
+                stats_by_id.update({v['id']: v for v in video_response.get('items', [])})
+
             videos = []
-            for item in playlist_response['items']:
+            for item in playlist_items:
                 video_id = item['contentDetails']['videoId']
                 snippet = item['snippet']
-                
-                # Get video statistics
-                video_response = self.youtube.videos().list(
-                    part='statistics,contentDetails',
-                    id=video_id
-                ).execute()
-                
-                if video_response['items']:
-                    video_stats = video_response['items'][0]['statistics']
-                    content_details = video_response['items'][0]['contentDetails']
-                    
+
+                video_item = stats_by_id.get(video_id)
+                if video_item:
+                    video_stats = video_item['statistics']
+                    content_details = video_item['contentDetails']
+
                     videos.append({
                         "videoId": video_id,
                         "title": snippet['title'],
@@ -213,12 +785,25 @@ class YouTubeAPI:
                     })
             
             logger.info(f"Fetched {len(videos)} videos")
+            _youtube_cache.set(cache_key, videos, CHANNEL_VIDEOS_TTL)
             return videos
 
         
         except Exception as e:
             logger.error(f"Error fetching channel videos: {e}")
             return []
+
+    def _paginate(self, request):
+        """Lazily yield playlist items, following nextPageToken as needed
+
+        Callers consume with itertools.islice, so only the pages actually
+        needed are fetched and no intermediate list is buffered.
+        """
+        while request is not None:
+            _youtube_bucket.acquire()
+            response = request.execute(num_retries=YOUTUBE_API_RETRIES)
+            yield from response.get('items', [])
+            request = self.youtube.playlistItems().list_next(request, response)
     
     def _get_mock_channel_data(self) -> Dict[str, Any]:
         """Return mock channel data when API is not available"""
@@ -266,34 +851,46 @@ class YouTubeAPI:
         """Get comments from a specific video"""
         if not self.youtube:
             return self._get_mock_comments()
-        
+
+        cache_key = f"yt:video_comments:{video_id}:{max_results}"
+        cached = _youtube_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             logger.info(f"Fetching comments for video: {video_id}")
             
             # Get comment threads for the video
+            _youtube_bucket.acquire()
             comments_response = self.youtube.commentThreads().list(
                 part='snippet',
                 videoId=video_id,
                 maxResults=max_results,
                 order='relevance'  # Get most relevant comments first
-            ).execute()
-            
-            comments = []
-            for item in comments_response.get('items', []):
-                comment = item['snippet']['topLevelComment']['snippet']
-                comment_text = comment['textDisplay']
-                # Clean up the comment text
-                comment_text = comment_text.replace('\n', ' ').strip()
-                if comment_text and len(comment_text) > 10:  # Filter out very short comments
-                    comments.append(comment_text)
+            ).execute(num_retries=YOUTUBE_API_RETRIES)
             
+            comments = self._extract_comments(comments_response)
+
             logger.info(f"Fetched {len(comments)} comments for video {video_id}")
+            _youtube_cache.set(cache_key, comments, VIDEO_COMMENTS_TTL)
             return comments
-            
+
         except Exception as e:
             logger.error(f"Error fetching comments for video {video_id}: {e}")
             return self._get_mock_comments()
-    
+
+    def _extract_comments(self, comments_response: Dict[str, Any]) -> List[str]:
+        """Extract and clean comment texts from a commentThreads response"""
+        comments = []
+        for item in comments_response.get('items', []):
+            comment = item['snippet']['topLevelComment']['snippet']
+            comment_text = comment['textDisplay']
+            # Clean up the comment text
+            comment_text = comment_text.translate(_CSV_CLEAN).strip()
+            if comment_text and len(comment_text) > 10:  # Filter out very short comments
+                comments.append(comment_text)
+        return comments
+
     def _get_mock_comments(self) -> List[str]:
         """Return mock comments as fallback"""
         return [
@@ -319,12 +916,66 @@ class YouTubeAPI:
             "This video changed my perspective completely."
         ]
 
+@dataclass
+class VideoArrays:
+    """Columnar (struct-of-arrays) view of a video list
+
+    Numeric columns live in contiguous int64 arrays so aggregates (sum,
+    mean, percentile) run as single vector ops instead of per-dict Python
+    loops over the list-of-dicts representation.
+    """
+    video_ids: np.ndarray
+    titles: np.ndarray
+    published: np.ndarray
+    views: np.ndarray
+    likes: np.ndarray
+    comments: np.ndarray
+    favorites: np.ndarray
+
+    @classmethod
+    def from_videos(cls, videos: List[Dict[str, Any]]) -> 'VideoArrays':
+        """Build columnar arrays from the API's list-of-dicts in one pass"""
+        n = len(videos)
+        video_ids = np.empty(n, dtype=object)
+        titles = np.empty(n, dtype=object)
+        published = np.empty(n, dtype=object)
+        views = np.empty(n, dtype=np.int64)
+        likes = np.empty(n, dtype=np.int64)
+        comments = np.empty(n, dtype=np.int64)
+        favorites = np.empty(n, dtype=np.int64)
+
+        for i, video in enumerate(videos):
+            video_ids[i] = video["videoId"]
+            titles[i] = video["title"]
+            published[i] = video["publishedAt"]
+            views[i] = video["viewCount"]
+            likes[i] = video["likeCount"]
+            comments[i] = video["commentCount"]
+            favorites[i] = video["favoriteCount"]
+
+        return cls(video_ids, titles, published, views, likes, comments, favorites)
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+
 class YouTubeAnalyticsEngine:
     """Core analytics engine for YouTube data processing"""
-    
+
     def __init__(self):
         self.base_data = self._initialize_base_data()
         self.current_channel_data = None
+        # Invariant view of the channel data: always a dict, so the hot
+        # analytics paths can use plain .get() without a None check.
+        self._effective_channel = {}
+        self.video_arrays = None
+        self._snapshot = None
+        # Bumped whenever the underlying data may have changed; cheap
+        # per-endpoint caches compare against it instead of a TTL.
+        self.data_version = 0
+        # Results of the pure analytics keyed on an input snapshot; every
+        # /api/overview hit between data refreshes reuses these
+        self._analytics_cache = {}
     
     def _initialize_base_data(self) -> Dict[str, Any]:
         """Initialize base YouTube data structure"""
@@ -351,7 +1002,13 @@ class YouTubeAnalyticsEngine:
     def update_channel_data(self, channel_data: Dict[str, Any], videos: List[Dict[str, Any]]):
         """Update analytics engine with new channel data"""
         self.current_channel_data = channel_data
-        
+        self._effective_channel = channel_data or {}
+        self.video_arrays = VideoArrays.from_videos(videos) if videos else None
+        self._snapshot = None
+        self.data_version += 1
+        self._analytics_cache.clear()
+        _overview_cache.clear()
+
         if videos:
             # Use the most recent video as current video
             latest_video = videos[0]
@@ -373,10 +1030,15 @@ class YouTubeAnalyticsEngine:
                 "impressions": latest_video["viewCount"] * 10  # Estimate
             }
     
-    def _parse_iso_duration(self, duration: str) -> str:
-        """Parse ISO 8601 duration to readable format"""
-        import re
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_iso_duration(duration: str) -> str:
+        """Parse ISO 8601 duration to readable format
+
+        Pure function over low-cardinality inputs (many videos share the
+        same duration string), so results are memoized.
+        """
+        match = _ISO_DURATION_RE.match(duration)
         if match:
             hours, minutes, seconds = match.groups()
             hours = int(hours) if hours else 0
@@ -391,26 +1053,89 @@ class YouTubeAnalyticsEngine:
     
     def calculate_views_over_time(self, days: int = 7) -> List[Dict[str, Any]]:
         """Calculate views over time with realistic growth patterns"""
+        # Negative day counts yield an empty trend, matching the old
+        # range(days) loop; np.arange tolerates them but _RNG.uniform raises
+        days = max(0, days)
         base_views = 1000
         growth_rate = 1.15  # 15% daily growth
-        views_data = []
-        
-        for i in range(days):
-            date = datetime.now() - timedelta(days=days-1-i)
-            # Add some randomness to make it more realistic
-            daily_views = int(base_views * (growth_rate ** i) * random.uniform(0.8, 1.2))
-            watch_time = daily_views * random.uniform(0.015, 0.025)  # 1.5-2.5% watch time ratio
-            
-            views_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "views": daily_views,
-                "watchTime": round(watch_time, 1)
-            })
-        
-        return views_data
+
+        # Vectorized: compute the whole growth curve and draw all the noise
+        # in one shot instead of looping day by day
+        growth_curve = base_views * growth_rate ** np.arange(days)
+        daily_views = (growth_curve * _RNG.uniform(0.8, 1.2, days)).astype(np.int64)
+        watch_times = daily_views * _RNG.uniform(0.015, 0.025, days)  # 1.5-2.5% watch time ratio
+
+        today = datetime.now()
+        return [
+            {
+                "date": (today - timedelta(days=days - 1 - i)).strftime("%Y-%m-%d"),
+                "views": int(views),
+                "watchTime": round(float(watch_time), 1)
+            }
+            for i, (views, watch_time) in enumerate(zip(daily_views, watch_times))
+        ]
     
+    def _analytics_snapshot(self) -> tuple:
+        """Hashable snapshot of every input the pure analytics read
+
+        The inputs only change in update_channel_data, which drops the
+        cached snapshot, so between refreshes the memoized analytics
+        short-circuit on a single stored fingerprint instead of
+        rebuilding and rehashing this tuple per call.
+        """
+        if self._snapshot is None:
+            current_video = self.base_data["currentVideo"]
+            channel = self._effective_channel
+            self._snapshot = (
+                current_video["id"], current_video["views"], current_video["likes"],
+                current_video["dislikes"], current_video["comments"], current_video["shares"],
+                current_video["clickThroughRate"], current_video["duration"],
+                current_video["avgViewDuration"],
+                channel.get("viewCount", 0), channel.get("subscriberCount", 0),
+                channel.get("videoCount", 0)
+            )
+        return self._snapshot
+
+    def _cached_analytics(self, name: str, compute) -> Any:
+        """Memoize a pure analytics computation against the current snapshot"""
+        key = (name, self._analytics_snapshot())
+        result = self._analytics_cache.get(key)
+        if result is None:
+            if len(self._analytics_cache) > 32:
+                self._analytics_cache.clear()
+            result = compute()
+            self._analytics_cache[key] = result
+        return result
+
+    def channel_video_stats(self) -> Optional[Dict[str, Any]]:
+        """Channel-wide aggregates over the fetched video list
+
+        Runs as single vector ops over the columnar VideoArrays instead
+        of Python loops over the list of dicts. None until a channel has
+        been fetched.
+        """
+        arrays = self.video_arrays
+        if arrays is None or len(arrays) == 0:
+            return None
+        total_views = int(arrays.views.sum())
+        total_likes = int(arrays.likes.sum())
+        total_comments = int(arrays.comments.sum())
+        engagement_rate = ((total_likes + total_comments) / max(total_views, 1)) * 100
+        return {
+            "videosAnalyzed": len(arrays),
+            "totalViews": total_views,
+            "avgViews": int(arrays.views.mean()),
+            "medianViews": int(np.median(arrays.views)),
+            "totalLikes": total_likes,
+            "totalComments": total_comments,
+            "avgEngagementRate": round(engagement_rate, 2)
+        }
+
     def calculate_engagement_metrics(self) -> Dict[str, Any]:
         """Calculate engagement metrics with advanced analytics"""
+        return self._cached_analytics("engagement", self._compute_engagement_metrics)
+
+    def _compute_engagement_metrics(self) -> Dict[str, Any]:
         current_video = self.base_data["currentVideo"]
         
         # Calculate engagement rate
@@ -433,7 +1158,9 @@ class YouTubeAnalyticsEngine:
             "avgViewDurationSeconds": avg_duration_seconds
         }
     
-    def _parse_duration(self, duration_str: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_duration(duration_str: str) -> int:
         """Parse duration string to seconds"""
         parts = duration_str.split(':')
         if len(parts) == 2:
@@ -444,13 +1171,16 @@ class YouTubeAnalyticsEngine:
     
     def calculate_performance_score(self) -> Dict[str, Any]:
         """Calculate overall performance score using advanced YouTube analytics algorithm"""
+        return self._cached_analytics("performance", self._compute_performance_score)
+
+    def _compute_performance_score(self) -> Dict[str, Any]:
         current_video = self.base_data["currentVideo"]
         engagement_metrics = self.calculate_engagement_metrics()
         
         # Use channel data if available for more accurate scoring
-        channel_views = self.current_channel_data.get("viewCount", 0) if self.current_channel_data else current_video["views"]
-        channel_subscribers = self.current_channel_data.get("subscriberCount", 0) if self.current_channel_data else 45230
-        video_count = self.current_channel_data.get("videoCount", 0) if self.current_channel_data else 150
+        channel_views = self._effective_channel.get("viewCount", current_video["views"])
+        channel_subscribers = self._effective_channel.get("subscriberCount", 45230)
+        video_count = self._effective_channel.get("videoCount", 150)
         
         # Industry benchmarks based on YouTube Creator Playbook and analytics research
         benchmarks = {
@@ -468,116 +1198,20 @@ class YouTubeAnalyticsEngine:
             "average_view_rate": 0.01   # 1% of subscribers is average
         }
         
-        # Calculate individual metric scores using percentile-based scoring
-        
-        # 1. Views Performance Score (0-100)
-        if channel_subscribers > 0:
-            view_rate = current_video["views"] / channel_subscribers
-            if view_rate >= benchmarks["viral_threshold"]:
-                views_score = 95 + min(5, (view_rate - benchmarks["viral_threshold"]) * 100)
-            elif view_rate >= benchmarks["good_view_rate"]:
-                views_score = 70 + ((view_rate - benchmarks["good_view_rate"]) / 
-                                   (benchmarks["viral_threshold"] - benchmarks["good_view_rate"])) * 25
-            elif view_rate >= benchmarks["average_view_rate"]:
-                views_score = 40 + ((view_rate - benchmarks["average_view_rate"]) / 
-                                   (benchmarks["good_view_rate"] - benchmarks["average_view_rate"])) * 30
-            else:
-                views_score = min(40, (view_rate / benchmarks["average_view_rate"]) * 40)
-        else:
-            # Fallback for channels without subscriber data
-            views_score = min(100, (current_video["views"] / 100000) * 80)
-        
-        # 2. Click-Through Rate Score (0-100)
-        ctr = current_video["clickThroughRate"]
-        if ctr >= benchmarks["excellent_ctr"]:
-            ctr_score = 95 + min(5, (ctr - benchmarks["excellent_ctr"]) / 2)
-        elif ctr >= benchmarks["good_ctr"]:
-            ctr_score = 75 + ((ctr - benchmarks["good_ctr"]) / 
-                             (benchmarks["excellent_ctr"] - benchmarks["good_ctr"])) * 20
-        elif ctr >= benchmarks["average_ctr"]:
-            ctr_score = 50 + ((ctr - benchmarks["average_ctr"]) / 
-                             (benchmarks["good_ctr"] - benchmarks["average_ctr"])) * 25
-        else:
-            ctr_score = (ctr / benchmarks["average_ctr"]) * 50
-        
-        # 3. Engagement Rate Score (0-100)
-        engagement_rate = engagement_metrics["engagementRate"]
-        if engagement_rate >= benchmarks["excellent_engagement"]:
-            engagement_score = 95 + min(5, (engagement_rate - benchmarks["excellent_engagement"]) / 2)
-        elif engagement_rate >= benchmarks["good_engagement"]:
-            engagement_score = 75 + ((engagement_rate - benchmarks["good_engagement"]) / 
-                                    (benchmarks["excellent_engagement"] - benchmarks["good_engagement"])) * 20
-        elif engagement_rate >= benchmarks["average_engagement"]:
-            engagement_score = 50 + ((engagement_rate - benchmarks["average_engagement"]) / 
-                                    (benchmarks["good_engagement"] - benchmarks["average_engagement"])) * 25
-        else:
-            engagement_score = (engagement_rate / benchmarks["average_engagement"]) * 50
-        
-        # 4. Watch Time/Retention Score (0-100)
-        retention_percentage = engagement_metrics["watchTimePercentage"]
-        if retention_percentage >= benchmarks["excellent_retention"]:
-            watch_time_score = 95 + min(5, (retention_percentage - benchmarks["excellent_retention"]) / 10)
-        elif retention_percentage >= benchmarks["good_retention"]:
-            watch_time_score = 75 + ((retention_percentage - benchmarks["good_retention"]) / 
-                                    (benchmarks["excellent_retention"] - benchmarks["good_retention"])) * 20
-        elif retention_percentage >= benchmarks["average_retention"]:
-            watch_time_score = 50 + ((retention_percentage - benchmarks["average_retention"]) / 
-                                    (benchmarks["good_retention"] - benchmarks["average_retention"])) * 25
-        else:
-            watch_time_score = (retention_percentage / benchmarks["average_retention"]) * 50
-        
-        # Advanced weighted scoring with dynamic weights based on content type and channel maturity
-        channel_maturity_factor = min(1.0, video_count / 100)  # Mature channels have 100+ videos
-        
-        # Dynamic weights that adjust based on channel maturity
-        if channel_maturity_factor > 0.8:  # Mature channel
-            weights = {
-                "views": 0.20,
-                "engagement_rate": 0.35,  # More weight on engagement for mature channels
-                "watch_time": 0.30,       # High importance on retention
-                "click_through_rate": 0.15
-            }
-        elif channel_maturity_factor > 0.4:  # Growing channel
-            weights = {
-                "views": 0.25,
-                "engagement_rate": 0.30,
-                "watch_time": 0.25,
-                "click_through_rate": 0.20
-            }
-        else:  # New channel
-            weights = {
-                "views": 0.30,           # More weight on views for new channels
-                "engagement_rate": 0.25,
-                "watch_time": 0.25,
-                "click_through_rate": 0.20
-            }
-        
-        # Calculate weighted performance score
-        performance_score = (
-            views_score * weights["views"] +
-            engagement_score * weights["engagement_rate"] +
-            watch_time_score * weights["watch_time"] +
-            ctr_score * weights["click_through_rate"]
+        # All the numeric scoring (benchmark-curve interpolation, maturity
+        # weighting, bonuses) lives in _score_kernel, JIT-compiled when
+        # Numba is installed
+        (views_score, ctr_score, engagement_score, watch_time_score,
+         channel_maturity_factor, consistency_bonus, viral_bonus,
+         final_score) = _score_kernel(
+            float(current_video["views"]),
+            float(channel_subscribers),
+            float(current_video["clickThroughRate"]),
+            float(engagement_metrics["engagementRate"]),
+            float(engagement_metrics["watchTimePercentage"]),
+            float(video_count)
         )
-        
-        # Apply bonus/penalty factors
-        
-        # Consistency bonus (if channel has good historical performance)
-        consistency_bonus = min(5, channel_maturity_factor * 5)
-        
-        # Viral content bonus (if views significantly exceed subscriber base)
-        if channel_subscribers > 0:
-            viral_ratio = current_video["views"] / channel_subscribers
-            if viral_ratio > 0.1:  # 10% of subscribers is viral
-                viral_bonus = min(10, (viral_ratio - 0.1) * 20)
-            else:
-                viral_bonus = 0
-        else:
-            viral_bonus = 0
-        
-        # Apply bonuses
-        final_score = min(100, performance_score + consistency_bonus + viral_bonus)
-        
+
         # Generate trend indicators
         trends = self._calculate_performance_trends({
             "views": views_score,
@@ -616,11 +1250,13 @@ class YouTubeAnalyticsEngine:
         # Simulate historical data for trend calculation
         # In a real implementation, this would compare against historical performance
         trends = {}
-        
-        for metric, current_score in scores.items():
+
+        # Draw all the simulated variances in one batch
+        variances = _RNG.uniform(-10, 10, len(scores))
+
+        for (metric, current_score), historical_variance in zip(scores.items(), variances):
             # Simulate previous period score (with some randomness for demo)
             # In production, this would come from historical data
-            historical_variance = random.uniform(-10, 10)
             previous_score = max(0, min(100, current_score + historical_variance))
             
             change = current_score - previous_score
@@ -647,243 +1283,200 @@ class YouTubeAnalyticsEngine:
     
     def _get_performance_grade(self, score: float) -> str:
         """Get performance grade based on score"""
-        if score >= 90:
-            return "A+"
-        elif score >= 85:
-            return "A"
-        elif score >= 80:
-            return "A-"
-        elif score >= 75:
-            return "B+"
-        elif score >= 70:
-            return "B"
-        elif score >= 65:
-            return "B-"
-        elif score >= 60:
-            return "C+"
-        elif score >= 55:
-            return "C"
-        elif score >= 50:
-            return "C-"
-        elif score >= 40:
-            return "D"
-        else:
-            return "F"
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_CUTOFFS, score)]
     
     def generate_recommendations(self) -> List[Dict[str, Any]]:
         """Generate actionable recommendations based on advanced analytics"""
+        return self._cached_analytics("recommendations", self._compute_recommendations)
+
+    def _compute_recommendations(self) -> List[Dict[str, Any]]:
         current_video = self.base_data["currentVideo"]
         engagement_metrics = self.calculate_engagement_metrics()
         performance = self.calculate_performance_score()
         
         # Use channel data for more accurate recommendations
-        channel_views = self.current_channel_data.get("viewCount", 0) if self.current_channel_data else current_video["views"]
-        channel_subscribers = self.current_channel_data.get("subscriberCount", 0) if self.current_channel_data else 45230
-        video_count = self.current_channel_data.get("videoCount", 0) if self.current_channel_data else 150
+        channel_views = self._effective_channel.get("viewCount", current_video["views"])
+        channel_subscribers = self._effective_channel.get("subscriberCount", 45230)
+        video_count = self._effective_channel.get("videoCount", 150)
         
         recommendations = []
         scores = performance["scores"]
         trends = performance["trends"]
-        
-        # Priority-based recommendation system
-        
-        # 1. Critical Issues (Score < 40)
-        if scores["views"] < 40:
-            view_rate = current_video["views"] / max(channel_subscribers, 1)
-            if view_rate < 0.005:  # Less than 0.5% of subscribers
-                recommendations.append({
-                    "id": 1,
-                    "type": "warning",
-                    "title": "Critical: Very Low View Performance",
-                    "description": f"Only {view_rate*100:.2f}% of your subscribers viewed this content. Consider: 1) Better thumbnails, 2) More engaging titles, 3) Optimal posting times, 4) Community engagement.",
-                    "priority": "high",
-                    "impact": "high",
-                    "category": "Views",
-                    "actionItems": [
-                        "A/B test thumbnail designs",
-                        "Analyze competitor titles",
-                        "Post when your audience is most active",
-                        "Engage with comments within first hour"
-                    ]
-                })
-        
-        if scores["watchTime"] < 40:
-            recommendations.append({
-                "id": 2,
-                "type": "warning",
-                "title": "Critical: Poor Audience Retention",
-                "description": f"Viewers are leaving after {engagement_metrics['watchTimePercentage']:.1f}% of your video. This severely impacts YouTube's algorithm ranking.",
-                "priority": "high",
-                "impact": "high",
-                "category": "Retention",
-                "actionItems": [
-                    "Hook viewers in first 15 seconds",
-                    "Remove slow/boring sections",
-                    "Add pattern interrupts every 30 seconds",
-                    "Use jump cuts and visual variety"
-                ]
-            })
-        
-        # 2. Improvement Opportunities (Score 40-70)
-        if 40 <= scores["ctr"] < 70:
-            ctr_value = current_video["clickThroughRate"]
-            recommendations.append({
-                "id": 3,
-                "type": "info",
-                "title": "Optimize Click-Through Rate",
-                "description": f"Your CTR of {ctr_value:.1f}% is below optimal. Industry leaders achieve 8-12% CTR through strategic thumbnail and title optimization.",
-                "priority": "medium",
-                "impact": "high",
-                "category": "CTR",
-                "actionItems": [
-                    "Use bright, contrasting colors in thumbnails",
-                    "Include emotional expressions in thumbnails",
-                    "Write curiosity-driven titles",
-                    "Test different thumbnail styles"
-                ]
-            })
-        
-        if 40 <= scores["engagement"] < 70:
-            recommendations.append({
-                "id": 4,
-                "type": "info",
-                "title": "Boost Audience Engagement",
-                "description": f"Engagement rate of {engagement_metrics['engagementRate']:.1f}% can be improved. Higher engagement signals quality content to YouTube's algorithm.",
-                "priority": "medium",
-                "impact": "medium",
-                "category": "Engagement",
-                "actionItems": [
-                    "Ask specific questions to encourage comments",
-                    "Create polls and community posts",
-                    "Respond to comments quickly",
-                    "End videos with clear call-to-action"
-                ]
-            })
-        
+
+        # Pull the scores into locals once; the branches below would
+        # otherwise re-read the dict dozens of times per request
+        s_views = scores["views"]
+        s_watch_time = scores["watchTime"]
+        s_ctr = scores["ctr"]
+        s_engagement = scores["engagement"]
+
+        # Format the shared display numbers once; plain interpolation of a
+        # prebuilt string is cheaper than a format spec in every branch
+        ctr_s = f"{current_video['clickThroughRate']:.1f}"
+        engagement_rate_s = f"{engagement_metrics['engagementRate']:.1f}"
+
+        # Priority-based recommendation system. The critical/improvement
+        # blocks only apply when something scores below 70, so the common
+        # "all healthy" case skips past all of them in one check.
+        if s_views < 70 or s_watch_time < 70 or s_ctr < 70 or s_engagement < 70:
+            # 1. Critical Issues (Score < 40)
+            if s_views < 40:
+                view_rate = current_video["views"] / max(channel_subscribers, 1)
+                if view_rate < 0.005:  # Less than 0.5% of subscribers
+                    view_pct_s = f"{view_rate * 100:.2f}"
+                    recommendations.append(Recommendation(
+                        id=1,
+                        type="warning",
+                        title="Critical: Very Low View Performance",
+                        description=f"Only {view_pct_s}% of your subscribers viewed this content. Consider: 1) Better thumbnails, 2) More engaging titles, 3) Optimal posting times, 4) Community engagement.",
+                        priority="high",
+                        impact="high",
+                        _rank=_PRIO["high"] * 4 + _PRIO["high"],
+                        category="Views",
+                        actionItems=_ACTIONS_LOW_VIEWS
+                    ))
+
+            if s_watch_time < 40:
+                watch_pct_s = f"{engagement_metrics['watchTimePercentage']:.1f}"
+                recommendations.append(Recommendation(
+                    id=2,
+                    type="warning",
+                    title="Critical: Poor Audience Retention",
+                    description=f"Viewers are leaving after {watch_pct_s}% of your video. This severely impacts YouTube's algorithm ranking.",
+                    priority="high",
+                    impact="high",
+                    _rank=_PRIO["high"] * 4 + _PRIO["high"],
+                    category="Retention",
+                    actionItems=_ACTIONS_RETENTION
+                ))
+
+            # 2. Improvement Opportunities (Score 40-70)
+            if 40 <= s_ctr < 70:
+                recommendations.append(Recommendation(
+                    id=3,
+                    type="info",
+                    title="Optimize Click-Through Rate",
+                    description=f"Your CTR of {ctr_s}% is below optimal. Industry leaders achieve 8-12% CTR through strategic thumbnail and title optimization.",
+                    priority="medium",
+                    impact="high",
+                    _rank=_PRIO["medium"] * 4 + _PRIO["high"],
+                    category="CTR",
+                    actionItems=_ACTIONS_CTR
+                ))
+
+            if 40 <= s_engagement < 70:
+                recommendations.append(Recommendation(
+                    id=4,
+                    type="info",
+                    title="Boost Audience Engagement",
+                    description=f"Engagement rate of {engagement_rate_s}% can be improved. Higher engagement signals quality content to YouTube's algorithm.",
+                    priority="medium",
+                    impact="medium",
+                    _rank=_PRIO["medium"] * 4 + _PRIO["medium"],
+                    category="Engagement",
+                    actionItems=_ACTIONS_ENGAGEMENT
+                ))
+
         # 3. Excellent Performance Recognition (Score > 80)
-        if scores["ctr"] > 80:
-            recommendations.append({
-                "id": 5,
-                "type": "success",
-                "title": "Excellent Click-Through Rate!",
-                "description": f"Outstanding CTR of {current_video['clickThroughRate']:.1f}%! This is significantly above average. Document what worked for future videos.",
-                "priority": "low",
-                "impact": "high",
-                "category": "CTR",
-                "actionItems": [
-                    "Document successful thumbnail elements",
-                    "Analyze title structure for patterns",
-                    "Create template based on this success",
-                    "Share insights with team/community"
-                ]
-            })
-        
-        if scores["engagement"] > 80:
-            recommendations.append({
-                "id": 6,
-                "type": "success",
-                "title": "Exceptional Audience Engagement!",
-                "description": f"Your engagement rate of {engagement_metrics['engagementRate']:.1f}% is excellent! This content resonates strongly with your audience.",
-                "priority": "low",
-                "impact": "medium",
-                "category": "Engagement",
-                "actionItems": [
-                    "Create similar content themes",
-                    "Analyze what topics drove engagement",
-                    "Consider making this a series",
-                    "Promote this video across platforms"
-                ]
-            })
+        if s_ctr > 80:
+            recommendations.append(Recommendation(
+                id=5,
+                type="success",
+                title="Excellent Click-Through Rate!",
+                description=f"Outstanding CTR of {ctr_s}%! This is significantly above average. Document what worked for future videos.",
+                priority="low",
+                impact="high",
+                _rank=_PRIO["low"] * 4 + _PRIO["high"],
+                category="CTR",
+                actionItems=_ACTIONS_CTR_SUCCESS
+            ))
+        
+        if s_engagement > 80:
+            recommendations.append(Recommendation(
+                id=6,
+                type="success",
+                title="Exceptional Audience Engagement!",
+                description=f"Your engagement rate of {engagement_rate_s}% is excellent! This content resonates strongly with your audience.",
+                priority="low",
+                impact="medium",
+                _rank=_PRIO["low"] * 4 + _PRIO["medium"],
+                category="Engagement",
+                actionItems=_ACTIONS_ENGAGEMENT_SUCCESS
+            ))
         
         # 4. Trend-based Recommendations
         for metric, trend_data in trends.items():
             if trend_data["direction"] == "down" and trend_data["strength"] == "strong":
-                metric_name = {
-                    "views": "Views",
-                    "engagement": "Engagement",
-                    "watchTime": "Watch Time",
-                    "ctr": "Click-Through Rate"
-                }.get(metric, metric)
+                metric_name = _METRIC_DISPLAY.get(metric, metric)
+                drop_s = f"{abs(trend_data['change']):.1f}"
                 
-                recommendations.append({
-                    "id": 7 + len(recommendations),
-                    "type": "warning",
-                    "title": f"Declining {metric_name} Trend",
-                    "description": f"{metric_name} has dropped by {abs(trend_data['change']):.1f} points recently. This needs immediate attention to prevent further decline.",
-                    "priority": "high",
-                    "impact": "medium",
-                    "category": "Trends",
-                    "actionItems": [
+                recommendations.append(Recommendation(
+                    id=7 + len(recommendations),
+                    type="warning",
+                    title=f"Declining {metric_name} Trend",
+                    description=f"{metric_name} has dropped by {drop_s} points recently. This needs immediate attention to prevent further decline.",
+                    priority="high",
+                    impact="medium",
+                    _rank=_PRIO["high"] * 4 + _PRIO["medium"],
+                    category="Trends",
+                    actionItems=(
                         f"Analyze recent {metric_name.lower()} performance",
                         "Compare with successful past content",
                         "Identify what changed in your approach",
-                        "Test returning to previous successful strategies"
-                    ]
-                })
+                        "Test returning to previous successful strategies",
+                    )
+                ))
         
         # 5. Channel Maturity-based Recommendations
         channel_maturity = performance["channelMaturity"]
         if channel_maturity < 30:  # New channel
-            recommendations.append({
-                "id": 10,
-                "type": "info",
-                "title": "New Channel Growth Strategy",
-                "description": f"As a newer channel ({video_count} videos), focus on consistency and finding your niche. Establish a regular posting schedule.",
-                "priority": "medium",
-                "impact": "high",
-                "category": "Growth",
-                "actionItems": [
-                    "Post consistently (same days/times)",
-                    "Focus on one main topic/niche",
-                    "Engage actively with similar channels",
-                    "Create eye-catching channel art"
-                ]
-            })
+            recommendations.append(Recommendation(
+                id=10,
+                type="info",
+                title="New Channel Growth Strategy",
+                description=f"As a newer channel ({video_count} videos), focus on consistency and finding your niche. Establish a regular posting schedule.",
+                priority="medium",
+                impact="high",
+                _rank=_PRIO["medium"] * 4 + _PRIO["high"],
+                category="Growth",
+                actionItems=_ACTIONS_NEW_CHANNEL
+            ))
         elif channel_maturity > 80:  # Mature channel
-            recommendations.append({
-                "id": 11,
-                "type": "info",
-                "title": "Mature Channel Optimization",
-                "description": f"With {video_count}+ videos, focus on optimizing your best content and exploring new formats to maintain growth.",
-                "priority": "low",
-                "impact": "medium",
-                "category": "Optimization",
-                "actionItems": [
-                    "Update thumbnails on top-performing videos",
-                    "Create playlists to increase session time",
-                    "Experiment with new content formats",
-                    "Consider collaborations with other creators"
-                ]
-            })
+            recommendations.append(Recommendation(
+                id=11,
+                type="info",
+                title="Mature Channel Optimization",
+                description=f"With {video_count}+ videos, focus on optimizing your best content and exploring new formats to maintain growth.",
+                priority="low",
+                impact="medium",
+                _rank=_PRIO["low"] * 4 + _PRIO["medium"],
+                category="Optimization",
+                actionItems=_ACTIONS_MATURE_CHANNEL
+            ))
         
         # 6. Viral Potential Recognition
         if performance["bonuses"]["viral"] > 5:
-            recommendations.append({
-                "id": 12,
-                "type": "success",
-                "title": "Viral Content Detected!",
-                "description": f"This content is performing exceptionally well beyond your subscriber base! Capitalize on this momentum.",
-                "priority": "high",
-                "impact": "high",
-                "category": "Viral",
-                "actionItems": [
-                    "Promote heavily across all social platforms",
-                    "Create follow-up content quickly",
-                    "Engage with all comments to boost algorithm",
-                    "Consider paid promotion to amplify reach"
-                ]
-            })
-        
-        # Sort recommendations by priority and impact
-        priority_order = {"high": 3, "medium": 2, "low": 1}
-        impact_order = {"high": 3, "medium": 2, "low": 1}
-        
-        recommendations.sort(
-            key=lambda x: (priority_order.get(x["priority"], 0), impact_order.get(x["impact"], 0)),
-            reverse=True
-        )
-        
-        return recommendations[:6]  # Return top 6 recommendations
+            recommendations.append(Recommendation(
+                id=12,
+                type="success",
+                title="Viral Content Detected!",
+                description=f"This content is performing exceptionally well beyond your subscriber base! Capitalize on this momentum.",
+                priority="high",
+                impact="high",
+                _rank=_PRIO["high"] * 4 + _PRIO["high"],
+                category="Viral",
+                actionItems=_ACTIONS_VIRAL
+            ))
+        
+        # Top 6 by the precomputed priority/impact rank; nlargest is
+        # O(n log 6) versus a full sort as more rule types are added.
+        # The serialization boundary back to plain dicts drops the
+        # internal sort key so the payload shape stays unchanged.
+        top = heapq.nlargest(6, recommendations, key=operator.attrgetter("_rank"))
+        return [
+            {k: v for k, v in asdict(rec).items() if k != "_rank"}
+            for rec in top
+        ]
     
     def get_overview_data(self) -> Dict[str, Any]:
         """Get comprehensive overview data"""
@@ -894,7 +1487,7 @@ class YouTubeAnalyticsEngine:
         
         # Get both last video views and channel total views
         last_video_views = self.base_data["currentVideo"]["views"]
-        channel_total_views = self.current_channel_data.get("viewCount", 0) if self.current_channel_data else last_video_views
+        channel_total_views = self._effective_channel.get("viewCount", last_video_views)
         
         # Create a modified currentVideo object with both values
         current_video_with_comparison = self.base_data["currentVideo"].copy()
@@ -908,20 +1501,43 @@ class YouTubeAnalyticsEngine:
             "performanceScore": performance_score,
             "recommendations": recommendations,
             "channelData": self.current_channel_data,
-            "lastUpdated": datetime.now().isoformat(),
+            "lastUpdated": _now_iso(),
             "analyticsVersion": "1.0.0"
         }
 
+def _mock_sentiment_pool(size: int = 1000) -> List[Dict[str, float]]:
+    """Pregenerated mock sentiment draws, matching the live score shape
+
+    Cycling through a fixed pool costs no RNG state updates per comment,
+    unlike four random.uniform calls.
+    """
+    # Drawn natively in float32: VADER scores carry ~3 significant
+    # decimals, so single precision matches the live path for half the
+    # memory bandwidth.
+    pos = _RNG.random(size, dtype=np.float32) * 0.8 + 0.1
+    neu = _RNG.random(size, dtype=np.float32) * 0.2 + 0.1
+    neg = _RNG.random(size, dtype=np.float32) * 0.2
+    compound = _RNG.random(size, dtype=np.float32) * 1.3 - 0.5
+    return [
+        {'pos': float(p), 'neu': float(u), 'neg': float(n), 'compound': float(c)}
+        for p, u, n, c in zip(pos, neu, neg, compound)
+    ]
+
+
 class SentimentAnalyzer:
     """Sentiment analysis engine for YouTube comments"""
     
     def __init__(self):
         self.analyzer = None
+        self._mock_pool = itertools.cycle(_mock_sentiment_pool())
         if SENTIMENT_AVAILABLE:
-            self.analyzer = SentimentIntensityAnalyzer()
+            self.analyzer = _SIA
             logger.info("Sentiment analyzer initialized successfully")
         else:
             logger.warning("Sentiment analyzer not available, using mock data")
+            # Bind the mock implementation once so the per-call path
+            # never re-tests analyzer availability.
+            self.analyze_sentiment = self._mock_sentiment
     
     def preprocess_text(self, text: str) -> str:
         """Basic text preprocessing"""
@@ -929,75 +1545,75 @@ class SentimentAnalyzer:
             return ""
         
         # Remove extra whitespace and convert to lowercase
-        text = re.sub(r'\s+', ' ', text.strip().lower())
+        text = _WS_RE.sub(' ', text.strip().lower())
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = _URL_RE.sub('', text)
         # Remove excessive punctuation
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
-        
+        text = _BANG_RE.sub('!', text)
+        text = _QMARK_RE.sub('?', text)
+
         return text
     
+    def _mock_sentiment(self, text: str = "") -> Dict[str, float]:
+        """Next pregenerated draw; used when VADER is unavailable"""
+        return next(self._mock_pool)
+
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze sentiment of a single text"""
-        if not self.analyzer or not text:
-            # Return mock sentiment if analyzer not available
-            return {
-                'pos': random.uniform(0.1, 0.9),
-                'neu': random.uniform(0.1, 0.3),
-                'neg': random.uniform(0.0, 0.2),
-                'compound': random.uniform(-0.5, 0.8)
-            }
+        if not text:
+            return self._mock_sentiment(text)
         
         processed_text = self.preprocess_text(text)
-        scores = self.analyzer.polarity_scores(processed_text)
-        return scores
+        neg, neu, pos, compound = _cached_polarity(processed_text)
+        return {'neg': neg, 'neu': neu, 'pos': pos, 'compound': compound}
     
     def analyze_comments(self, comments: List[str]) -> Dict[str, Any]:
         """Analyze sentiment for a list of comments"""
         if not comments:
             return self._get_mock_sentiment_data()
         
-        sentiments = []
-        positive_count = 0
-        neutral_count = 0
-        negative_count = 0
-        total_compound = 0
-        
-        for comment in comments:
-            if not comment or len(comment.strip()) < 3:
-                continue
-                
-            sentiment = self.analyze_sentiment(comment)
-            sentiments.append({
-                'text': comment[:100] + '...' if len(comment) > 100 else comment,
-                'sentiment': sentiment,
-                'classification': self._classify_sentiment(sentiment['compound'])
-            })
-            
-            # Count classifications
-            if sentiment['compound'] >= 0.05:
-                positive_count += 1
-            elif sentiment['compound'] <= -0.05:
-                negative_count += 1
-            else:
-                neutral_count += 1
-            
-            total_compound += sentiment['compound']
-        
-        total_comments = len(sentiments)
+        valid = [c for c in comments if c and len(c.strip()) >= 3]
+        total_comments = len(valid)
         if total_comments == 0:
             return self._get_mock_sentiment_data()
-        
+
+        # Score the whole batch up front so large batches can be sharded
+        # across the worker processes instead of holding the request
+        # thread for the full serial loop.
+        if self.analyzer:
+            scored = [
+                {'neg': p[0], 'neu': p[1], 'pos': p[2], 'compound': p[3]}
+                for p in _score_polarities([self.preprocess_text(c) for c in valid])
+            ]
+        else:
+            scored = [self.analyze_sentiment(c) for c in valid]
+
+        # Classify and aggregate with boolean masks over the compound
+        # scores instead of per-comment Python branching
+        compounds = np.fromiter(
+            (s['compound'] for s in scored),
+            dtype=np.float32,
+            count=total_comments
+        )
+        positive_count = int((compounds >= 0.05).sum())
+        negative_count = int((compounds <= -0.05).sum())
+        neutral_count = total_comments - positive_count - negative_count
+
         # Calculate percentages
         positive_pct = (positive_count / total_comments) * 100
         neutral_pct = (neutral_count / total_comments) * 100
         negative_pct = (negative_count / total_comments) * 100
-        
+
         # Calculate overall rating (1-5 scale)
-        avg_compound = total_compound / total_comments
+        avg_compound = float(compounds.mean())
         overall_rating = max(1.0, min(5.0, 3.0 + (avg_compound * 2)))
-        
+
+        # Only the first 50 per-comment dicts (plus the two extremes) are
+        # ever returned, so the rest are never materialized.
+        detailed = [self._detail(c, s) for c, s in zip(valid[:50], scored[:50])]
+        best = int(compounds.argmax())
+        worst = int(compounds.argmin())
+
         return {
             'overview': {
                 'positive_percentage': round(positive_pct, 1),
@@ -1007,16 +1623,24 @@ class SentimentAnalyzer:
                 'total_comments': total_comments,
                 'avg_compound_score': round(avg_compound, 3)
             },
-            'detailed_sentiments': sentiments[:50],  # Limit to first 50 for performance
+            'detailed_sentiments': detailed,  # Limit to first 50 for performance
             'summary': {
-                'most_positive': max(sentiments, key=lambda x: x['sentiment']['compound']) if sentiments else None,
-                'most_negative': min(sentiments, key=lambda x: x['sentiment']['compound']) if sentiments else None,
-                'dominant_sentiment': 'positive' if positive_pct > max(neutral_pct, negative_pct) else 
+                'most_positive': detailed[best] if best < len(detailed) else self._detail(valid[best], scored[best]),
+                'most_negative': detailed[worst] if worst < len(detailed) else self._detail(valid[worst], scored[worst]),
+                'dominant_sentiment': 'positive' if positive_pct > max(neutral_pct, negative_pct) else
                                     'negative' if negative_pct > neutral_pct else 'neutral'
             },
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _now_iso()
         }
     
+    def _detail(self, comment: str, sentiment: Dict[str, float]) -> Dict[str, Any]:
+        """Per-comment payload entry for detailed_sentiments"""
+        return {
+            'text': comment[:100] + '...' if len(comment) > 100 else comment,
+            'sentiment': sentiment,
+            'classification': self._classify_sentiment(sentiment['compound'])
+        }
+
     def _classify_sentiment(self, compound_score: float) -> str:
         """Classify sentiment based on compound score"""
         if compound_score >= 0.05:
@@ -1065,7 +1689,7 @@ class SentimentAnalyzer:
                 'most_positive': {'text': mock_comments[0], 'sentiment': {'compound': 0.8}},
                 'most_negative': {'text': mock_comments[2], 'sentiment': {'compound': -0.2}}
             },
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _now_iso()
         }
 
 # Initialize sentiment analyzer
@@ -1073,98 +1697,90 @@ sentiment_analyzer = SentimentAnalyzer()
 
 # Add the missing endpoint
 @app.route('/api/fetch-youtube-data', methods=['POST'])
+@safe_endpoint("Failed to fetch YouTube data")
 def fetch_youtube_data():
     """Fetch YouTube channel data from URL"""
-    try:
-        data = request.get_json()
-        channel_url = data.get('channelUrl')
-        
-        if not channel_url:
-            return jsonify({"error": "Channel URL is required"}), 400
-        
-        logger.info(f"Fetching YouTube data for URL: {channel_url}")
-        
-        # Get channel information
-        channel_data = youtube_api.get_channel_info(channel_url)
-        if "error" in channel_data:
-            return jsonify(channel_data), 400
-        
-        # Get channel videos
-        videos = youtube_api.get_channel_videos(channel_data["channelId"])
-        
-        # Update analytics engine with new data
-        analytics_engine.update_channel_data(channel_data, videos)
-        
-        # Get updated overview data
-        overview_data = analytics_engine.get_overview_data()
-        
-        return jsonify({
-            "success": True,
-            "channelData": channel_data,
-            "videos": videos,
-            "analytics": overview_data,
-            "message": "YouTube data fetched successfully"
-        })
-        
-    except Exception as e:
-        logger.error(f"Error fetching YouTube data: {str(e)}")
-        return jsonify({"error": "Failed to fetch YouTube data"}), 500
+    data = request.get_json()
+    channel_url = data.get('channelUrl')
+
+    if not channel_url:
+        return jsonify({"error": "Channel URL is required"}), 400
+
+    logger.info(f"Fetching YouTube data for URL: {channel_url}")
+
+    # Get channel information
+    channel_data = youtube_api.get_channel_info(channel_url)
+    if "error" in channel_data:
+        return jsonify(channel_data), 400
+
+    # Get channel videos
+    videos = youtube_api.get_channel_videos(channel_data["channelId"])
+
+    # Update analytics engine with new data
+    analytics_engine.update_channel_data(channel_data, videos)
+
+    # Get updated overview data
+    overview_data = analytics_engine.get_overview_data()
+
+    return jsonify({
+        "success": True,
+        "channelData": channel_data,
+        "videos": videos,
+        "videoStats": analytics_engine.channel_video_stats(),
+        "analytics": overview_data,
+        "message": "YouTube data fetched successfully"
+    })
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     return jsonify({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "service": "YouTube Analytics API"
     })
 
 @app.route('/api/overview', methods=['GET'])
+@safe_endpoint("Failed to get overview data")
 def get_overview():
     """Get overview tab data"""
-    try:
+    overview_data = _overview_cache.get("overview")
+    if overview_data is None:
         overview_data = analytics_engine.get_overview_data()
-        logger.info("Overview data requested successfully")
-        return jsonify(overview_data)
-    except Exception as e:
-        logger.error(f"Error getting overview data: {str(e)}")
-        return jsonify({"error": "Failed to get overview data"}), 500
+        _overview_cache.set("overview", overview_data, OVERVIEW_TTL)
+    logger.info("Overview data requested successfully")
+    return _json(overview_data)
 
 @app.route('/api/metrics', methods=['GET'])
+@safe_endpoint("Failed to get metrics")
 def get_metrics():
     """Get key metrics for overview tab"""
-    try:
-        current_video = analytics_engine.base_data["currentVideo"]
-        engagement_metrics = analytics_engine.calculate_engagement_metrics()
-        
-        # Use channel's total view count instead of just the last video's views
-        channel_total_views = analytics_engine.current_channel_data.get("viewCount", 0) if analytics_engine.current_channel_data else current_video["views"]
-        
-        metrics = {
-            "totalViews": channel_total_views,  # Use channel's total views
-            "watchTime": current_video["watchTime"],
-            "engagementRate": engagement_metrics["engagementRate"],
-            "clickThroughRate": current_video["clickThroughRate"],
-            "totalLikes": current_video["likes"],
-            "totalComments": current_video["comments"],
-            "avgViewDuration": current_video["avgViewDuration"]
-        }
-        
-        return jsonify(metrics)
-    except Exception as e:
-        logger.error(f"Error getting metrics: {str(e)}")
-        return jsonify({"error": "Failed to get metrics"}), 500
+    current_video = analytics_engine.base_data["currentVideo"]
+    engagement_metrics = analytics_engine.calculate_engagement_metrics()
+
+    # Use channel's total view count instead of just the last video's views
+    channel_total_views = analytics_engine._effective_channel.get("viewCount", current_video["views"])
+
+    metrics = {
+        "totalViews": channel_total_views,  # Use channel's total views
+        "watchTime": current_video["watchTime"],
+        "engagementRate": engagement_metrics["engagementRate"],
+        "clickThroughRate": current_video["clickThroughRate"],
+        "totalLikes": current_video["likes"],
+        "totalComments": current_video["comments"],
+        "avgViewDuration": current_video["avgViewDuration"]
+    }
+
+    return jsonify(metrics)
 
 @app.route('/api/views-trend', methods=['GET'])
+@safe_endpoint("Failed to get views trend")
 def get_views_trend():
     """Get views trend data"""
-    try:
-        days = request.args.get('days', 7, type=int)
-        views_data = analytics_engine.calculate_views_over_time(days)
-        return jsonify(views_data)
-    except Exception as e:
-        logger.error(f"Error getting views trend: {str(e)}")
-        return jsonify({"error": "Failed to get views trend"}), 500
+    days = request.args.get('days', 7, type=int)
+    views_data = analytics_engine.calculate_views_over_time(days)
+    return jsonify(views_data)
 
 @app.route('/api/performance', methods=['GET'])
 def get_performance():
@@ -1192,7 +1808,7 @@ def get_performance():
             'video_info': {
                 'video_id': current_video['id'],
                 'video_title': current_video['title'],
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': _now_iso()
             },
             'analysis_method': gemini_analysis.get('analysis_method', 'gemini_ai')
         }
@@ -1219,7 +1835,7 @@ def get_performance():
                 'video_info': {
                     'video_id': 'fallback',
                     'video_title': 'Fallback Analysis',
-                    'analysis_timestamp': datetime.now().isoformat()
+                    'analysis_timestamp': _now_iso()
                 }
             })
         except Exception as fallback_error:
@@ -1227,53 +1843,77 @@ def get_performance():
             return jsonify({"error": "Failed to get performance data"}), 500
 
 @app.route('/api/engagement-rate', methods=['GET'])
+@safe_endpoint("Failed to get engagement rate")
 def get_engagement_rate():
     """Get real-time engagement rate for the latest video"""
-    try:
-        current_video = analytics_engine.base_data["currentVideo"]
-        
-        # Calculate engagement rate: (likes + comments) / views * 100
-        likes = current_video["likes"]
-        comments = current_video["comments"]
-        views = current_video["views"]
-        
-        if views > 0:
-            engagement_rate = ((likes + comments) / views) * 100
-        else:
-            engagement_rate = 0
-        
-        # Calculate trend (mock for now - could be enhanced with historical data)
-        trend_change = round(random.uniform(-1, 3), 1)  # Random trend between -1% to +3%
-        trend_direction = "up" if trend_change > 0 else "down" if trend_change < 0 else "stable"
-        
-        return jsonify({
-            "engagementRate": round(engagement_rate, 2),
-            "likes": likes,
-            "comments": comments,
-            "views": views,
-            "totalEngagements": likes + comments,
-            "trend": {
-                "change": abs(trend_change),
-                "direction": trend_direction
-            },
-            "calculation": f"({likes:,} likes + {comments:,} comments) / {views:,} views × 100",
-            "lastUpdated": datetime.now().isoformat()
-        })
-    except Exception as e:
-        logger.error(f"Error getting engagement rate: {str(e)}")
-        return jsonify({"error": "Failed to get engagement rate"}), 500
+    current_video = analytics_engine.base_data["currentVideo"]
+
+    # Calculate engagement rate: (likes + comments) / views * 100
+    likes = current_video["likes"]
+    comments = current_video["comments"]
+    views = current_video["views"]
+
+    if views > 0:
+        engagement_rate = ((likes + comments) / views) * 100
+    else:
+        engagement_rate = 0
+
+    # Calculate trend (mock for now - could be enhanced with historical data)
+    trend_change = round(random.uniform(-1, 3), 1)  # Random trend between -1% to +3%
+    trend_direction = "up" if trend_change > 0 else "down" if trend_change < 0 else "stable"
+
+    return jsonify({
+        "engagementRate": round(engagement_rate, 2),
+        "likes": likes,
+        "comments": comments,
+        "views": views,
+        "totalEngagements": likes + comments,
+        "trend": {
+            "change": abs(trend_change),
+            "direction": trend_direction
+        },
+        "calculation": f"({likes:,} likes + {comments:,} comments) / {views:,} views × 100",
+        "lastUpdated": _now_iso()
+    })
 
 @app.route('/api/recommendations', methods=['GET'])
+@safe_endpoint("Failed to get recommendations")
 def get_recommendations():
     """Get actionable recommendations"""
-    try:
-        recommendations = analytics_engine.generate_recommendations()
-        return jsonify(recommendations)
-    except Exception as e:
-        logger.error(f"Error getting recommendations: {str(e)}")
-        return jsonify({"error": "Failed to get recommendations"}), 500
+    recommendations = analytics_engine.generate_recommendations()
+    return _json(recommendations)
+
+def _sentiment_cache_key(*args, **kwargs):
+    """Cache key for the sentiment endpoint
+
+    Keyed on the current video and data_version so a refresh or channel
+    switch invalidates the entry immediately instead of waiting out the
+    five-minute timeout.
+    """
+    current_video_id = analytics_engine.base_data["currentVideo"]["id"]
+    include_csv = request.args.get('include_csv', 'false').lower()
+    return f"sentiment:{current_video_id}:{analytics_engine.data_version}:{include_csv}"
+
+def _cacheable_sentiment_response(response):
+    """Only cache full Gemini-backed successes
+
+    Error responses and VADER/mock-degraded payloads must not be pinned
+    under the same key for the whole timeout — one bad request would
+    otherwise serve its fallback for five minutes. Same rationale as
+    the transcript cache, which also stores successes only.
+    """
+    if isinstance(response, tuple) or response.status_code != 200:
+        return False
+    payload = response.get_json(silent=True) or {}
+    if payload.get('video_info', {}).get('analysis_method') != 'gemini_llm':
+        return False
+    # A nominal success whose every row came from the per-comment
+    # fallback means Gemini never answered; let the next poll retry.
+    sources = {row.get('source') for row in payload.get('detailed_sentiments', [])}
+    return bool(sources & {'gemini_api', 'semantic_cache'})
 
 @app.route('/api/sentiment-analysis', methods=['GET'])
+@cache.cached(make_cache_key=_sentiment_cache_key, response_filter=_cacheable_sentiment_response)
 def get_sentiment_analysis():
     """Get LLM-based sentiment analysis of video comments from the latest video"""
     try:
@@ -1299,8 +1939,10 @@ def get_sentiment_analysis():
         comments_csv = llm_sentiment_analyzer.create_comments_csv(comments)
         logger.info(f"Created CSV with {len(comments)} comments for LLM analysis")
         
-        # Analyze sentiment using LLM (Gemini API)
-        sentiment_data = llm_sentiment_analyzer.analyze_with_gemini(comments)
+        # Analyze sentiment using LLM (Gemini API); the CSV rendering is
+        # only embedded when explicitly asked for
+        include_csv = request.args.get('include_csv', 'false').lower() == 'true'
+        sentiment_data = llm_sentiment_analyzer.analyze_with_gemini(comments, include_csv=include_csv)
         
         # Add metadata about the video and processing
         sentiment_data['video_info'] = {
@@ -1359,54 +2001,181 @@ def get_sentiment_analysis():
             logger.error(f"Fallback sentiment analysis also failed: {str(fallback_error)}")
             return jsonify({"error": "Failed to get sentiment analysis"}), 500
 
+@app.route('/api/sentiment-analysis/csv', methods=['GET'])
+@safe_endpoint("Failed to get sentiment analysis CSV")
+def get_sentiment_analysis_csv():
+    """Stream per-comment sentiment results as a CSV download"""
+    current_video_id = analytics_engine.base_data["currentVideo"]["id"]
+
+    if not hasattr(get_sentiment_analysis, 'youtube_api'):
+        get_sentiment_analysis.youtube_api = YouTubeAPI()
+
+    comments = get_sentiment_analysis.youtube_api.get_video_comments(current_video_id, max_results=50)
+    if not comments:
+        comments = get_sentiment_analysis.youtube_api._get_mock_comments()
+
+    # Repeat analyses hit the prompt and normalized-text caches, so this
+    # does not re-spend LLM calls after the JSON endpoint ran.
+    results = llm_sentiment_analyzer._analyze_comments(comments)
+    return Response(
+        stream_with_context(llm_sentiment_analyzer.iter_results_csv(results)),
+        mimetype='text/csv',
+        headers={"Content-Disposition": "attachment; filename=sentiment_results.csv"}
+    )
+
 @app.route('/api/likes-dislikes', methods=['GET'])
+@safe_endpoint("Failed to get likes vs dislikes data")
 def get_likes_dislikes():
     """Get likes vs dislikes data for the current video"""
-    try:
-        current_video = analytics_engine.base_data["currentVideo"]
-        likes = current_video["likes"]
-        dislikes = current_video.get("dislikes", max(1, int(likes * 0.02)))  # Estimate dislikes if not available
-        
-        total_reactions = likes + dislikes
-        like_percentage = (likes / total_reactions) * 100 if total_reactions > 0 else 0
-        dislike_percentage = (dislikes / total_reactions) * 100 if total_reactions > 0 else 0
-        
-        ratio = likes / dislikes if dislikes > 0 else likes
-        
-        likes_dislikes_data = {
-            "likes": likes,
-            "dislikes": dislikes,
-            "total_reactions": total_reactions,
-            "like_percentage": round(like_percentage, 1),
-            "dislike_percentage": round(dislike_percentage, 1),
-            "ratio": round(ratio, 1),
-            "ratio_text": f"{round(ratio, 1)}:1",
-            "chart_data": [
-                {"name": "Likes", "value": likes, "color": "#10b981"},
-                {"name": "Dislikes", "value": dislikes, "color": "#ef4444"}
-            ],
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        logger.info("Likes vs dislikes data requested successfully")
-        return jsonify(likes_dislikes_data)
-    except Exception as e:
-        logger.error(f"Error getting likes vs dislikes data: {str(e)}")
-        return jsonify({"error": "Failed to get likes vs dislikes data"}), 500
+    if _ld_cache["version"] == analytics_engine.data_version:
+        return _json(_ld_cache["payload"])
+
+    current_video = analytics_engine.base_data["currentVideo"]
+    likes = current_video["likes"]
+    dislikes = current_video.get("dislikes", max(1, int(likes * 0.02)))  # Estimate dislikes if not available
+
+    total_reactions = likes + dislikes
+    like_percentage = (likes / total_reactions) * 100 if total_reactions > 0 else 0
+    dislike_percentage = (dislikes / total_reactions) * 100 if total_reactions > 0 else 0
+
+    ratio = likes / dislikes if dislikes > 0 else likes
+
+    likes_dislikes_data = {
+        "likes": likes,
+        "dislikes": dislikes,
+        "total_reactions": total_reactions,
+        "like_percentage": round(like_percentage, 1),
+        "dislike_percentage": round(dislike_percentage, 1),
+        "ratio": round(ratio, 1),
+        "ratio_text": f"{round(ratio, 1)}:1",
+        "chart_data": [
+            {"name": "Likes", "value": likes, "color": "#10b981"},
+            {"name": "Dislikes", "value": dislikes, "color": "#ef4444"}
+        ],
+        "last_updated": _now_iso()
+    }
+
+    _ld_cache["version"] = analytics_engine.data_version
+    _ld_cache["payload"] = likes_dislikes_data
+
+    logger.info("Likes vs dislikes data requested successfully")
+    return _json(likes_dislikes_data)
 
 @app.route('/api/refresh', methods=['POST'])
+@safe_endpoint("Failed to refresh data")
 def refresh_data():
     """Refresh analytics data"""
-    try:
-        # In a real implementation, this would fetch fresh data from YouTube API
-        logger.info("Data refresh requested")
-        return jsonify({
-            "message": "Data refreshed successfully",
-            "timestamp": datetime.now().isoformat()
-        })
-    except Exception as e:
-        logger.error(f"Error refreshing data: {str(e)}")
-        return jsonify({"error": "Failed to refresh data"}), 500
+    # In a real implementation, this would fetch fresh data from YouTube API
+    analytics_engine.data_version += 1
+    logger.info("Data refresh requested")
+    return jsonify({
+        "message": "Data refreshed successfully",
+        "timestamp": _now_iso()
+    })
+
+@dataclass
+class SentimentBatch:
+    """Columnar (struct-of-arrays) view of per-comment LLM results
+
+    Mirrors VideoArrays: aggregation runs on contiguous arrays instead
+    of walking a list of five-key dicts, and per-comment dicts are only
+    materialized for the handful of rows a response actually returns.
+    """
+    ids: np.ndarray
+    texts: np.ndarray
+    sentiments: np.ndarray
+    confidences: np.ndarray
+    sources: np.ndarray
+    codes: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: List[Dict[str, Any]]) -> 'SentimentBatch':
+        n = len(results)
+        ids = np.empty(n, dtype=object)
+        texts = np.empty(n, dtype=object)
+        sentiments = np.empty(n, dtype='U8')
+        confidences = np.empty(n, dtype=np.float32)
+        sources = np.empty(n, dtype='U16')
+        # Numeric sentiment codes (+1 / -1 / 0) feed the stats kernel,
+        # which cannot compare unicode columns
+        codes = np.zeros(n, dtype=np.int8)
+        for i, result in enumerate(results):
+            ids[i] = result['comment_id']
+            texts[i] = result['comment_text']
+            sentiment = result['sentiment']
+            sentiments[i] = sentiment
+            confidences[i] = result['confidence']
+            sources[i] = result['source']
+            if sentiment == 'positive':
+                codes[i] = 1
+            elif sentiment == 'negative':
+                codes[i] = -1
+        return cls(ids, texts, sentiments, confidences, sources, codes)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Materialize one row back into the payload dict shape"""
+        return {
+            'comment_id': self.ids[i],
+            'comment_text': self.texts[i],
+            'sentiment': str(self.sentiments[i]),
+            'confidence': round(float(self.confidences[i]), 3),
+            'source': str(self.sources[i])
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# Bucket thresholds stored as float32 so the compiled and plain-Python
+# paths compare in the same precision: under numba a float32 confidence
+# of exactly 0.8 would otherwise promote to 0.80000001 > 0.8 and land
+# in a different bucket than the interpreter puts it in.
+_CONF_HIGH = np.float32(0.8)
+_CONF_MEDIUM = np.float32(0.5)
+
+
+@njit(cache=True)
+def _sentiment_stats(confidences: np.ndarray, codes: np.ndarray):
+    """Single-pass stats over a SentimentBatch
+
+    Counts the positive/negative classes and the high/medium confidence
+    buckets and tracks the most confident row of each class, replacing
+    five separate array traversals. Compiles under Numba when present;
+    runs as plain Python with identical results otherwise. Returns
+    (positive, negative, high, medium, best_positive, best_negative),
+    the last two being row indices or -1 when the class is absent.
+    """
+    positive = 0
+    negative = 0
+    high = 0
+    medium = 0
+    best_positive = -1
+    best_negative = -1
+    best_positive_conf = -1.0
+    best_negative_conf = -1.0
+    for i in range(confidences.size):
+        confidence = confidences[i]
+        if codes[i] == 1:
+            positive += 1
+            if confidence > best_positive_conf:
+                best_positive_conf = confidence
+                best_positive = i
+        elif codes[i] == -1:
+            negative += 1
+            if confidence > best_negative_conf:
+                best_negative_conf = confidence
+                best_negative = i
+        if confidence > _CONF_HIGH:
+            high += 1
+        elif confidence >= _CONF_MEDIUM:
+            medium += 1
+    return positive, negative, high, medium, best_positive, best_negative
+
+
+if NUMBA_AVAILABLE:
+    # Same eager-compilation rationale as _score_kernel above
+    _sentiment_stats(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int8))
+
 
 class LLMSentimentAnalyzer:
     """Enhanced sentiment analysis using Google Gemini API"""
@@ -1418,6 +2187,13 @@ class LLMSentimentAnalyzer:
         self.gemini_headers = {
             "Content-Type": "application/json"
         }
+        # Pooled module-level session: keep-alive connections skip the
+        # TLS handshake on every batch request.
+        self.session = _SESSION
+        # Shared module-level VADER instance for the fallback path; a
+        # fresh SentimentIntensityAnalyzer would re-parse the lexicon
+        # file on every fallback comment.
+        self._vader = _SIA if SENTIMENT_AVAILABLE else None
         logger.info("LLM Sentiment Analyzer initialized with Gemini API")
     
     def create_comments_csv(self, comments: List[str]) -> str:
@@ -1431,28 +2207,95 @@ class LLMSentimentAnalyzer:
         # Write comments
         for i, comment in enumerate(comments, 1):
             # Clean comment text for CSV
-            clean_comment = comment.replace('\n', ' ').replace('\r', ' ').strip()
+            clean_comment = comment.translate(_CSV_CLEAN).strip()
             writer.writerow([f'comment_{i}', clean_comment])
         
         csv_content = output.getvalue()
         output.close()
         return csv_content
     
-    def analyze_with_gemini(self, comments: List[str]) -> Dict[str, Any]:
+    def analyze_with_gemini(self, comments: List[str], include_csv: bool = False) -> Dict[str, Any]:
         """Analyze sentiment using Google Gemini API"""
+        return self._process_llm_results(self._analyze_comments(comments), include_csv=include_csv)
+
+    def _analyze_comments(self, comments: List[str]) -> List[Dict[str, Any]]:
+        """Raw per-comment sentiment results, cache hits plus LLM batches"""
+        results = [None] * len(comments)
+        miss_idx = []
+
+        # Answer near-duplicate comments from the normalized-text cache;
+        # only unseen text is sent to the LLM.
+        for i, comment in enumerate(comments):
+            key = _normalize_comment(comment)
+            cached = _llm_sentiment_cache.get(key) if key else None
+            if cached is not None:
+                results[i] = {
+                    'comment_id': f'comment_{i + 1}',
+                    'comment_text': comment,
+                    'sentiment': cached[0],
+                    'confidence': cached[1],
+                    'source': 'semantic_cache'
+                }
+            else:
+                miss_idx.append(i)
+
+        if miss_idx:
+            fresh = self._analyze_batches([comments[i] for i in miss_idx])
+            for i, result in zip(miss_idx, fresh):
+                result['comment_id'] = f'comment_{i + 1}'
+                results[i] = result
+                if result['source'] == 'gemini_api':
+                    key = _normalize_comment(result['comment_text'])
+                    if key:
+                        _llm_sentiment_cache.set(
+                            key,
+                            (result['sentiment'], result['confidence']),
+                            GEMINI_CACHE_TTL
+                        )
+
+        return results
+
+    def _analyze_batches(self, comments: List[str]) -> List[Dict[str, Any]]:
+        """Run the Gemini batches, returning one result per comment
+
+        Each batch is an independent I/O-bound HTTPS call, so batches run
+        concurrently under the shared token bucket instead of serially
+        with a fixed inter-batch sleep.
+        """
+        batches = []
+        batch_start = 0
+        while batch_start < len(comments):
+            batch = comments[batch_start:batch_start + GEMINI_BATCH_SIZE]
+            # Halve the batch until its estimated prompt tokens fit
+            while len(batch) > 1 and sum(len(c) // 4 for c in batch) > GEMINI_BATCH_TOKEN_BUDGET:
+                batch = batch[:len(batch) // 2]
+            batches.append((batch_start, batch))
+            batch_start += len(batch)
+
+        if len(batches) == 1:
+            return self._analyze_batch(*batches[0])
+
         results = []
-        
-        # Process comments in batches for efficiency
-        batch_size = 10
-        for batch_start in range(0, len(comments), batch_size):
-            batch_comments = comments[batch_start:batch_start + batch_size]
-            
-            try:
-                # Create prompt for batch sentiment analysis
-                prompt = self._create_gemini_prompt(batch_comments, batch_start)
-                
+        with ThreadPoolExecutor(max_workers=GEMINI_BATCH_WORKERS) as pool:
+            for batch_results in pool.map(lambda b: self._analyze_batch(*b), batches):
+                results.extend(batch_results)
+        return results
+
+    def _analyze_batch(self, batch_start: int, batch_comments: List[str]) -> List[Dict[str, Any]]:
+        """Analyze one batch, with jittered backoff on rate limiting"""
+        try:
+            # Create prompt for batch sentiment analysis
+            prompt = self._create_gemini_prompt(batch_comments, batch_start)
+
+            cache_key = _gemini_cache_key(self.gemini_api_url, 0.1, prompt)
+            cached_text = _gemini_cache.get(cache_key)
+            if cached_text is not None:
+                return self._parse_gemini_response(cached_text, batch_comments, batch_start)
+
+            for attempt in range(GEMINI_MAX_ATTEMPTS):
+                _gemini_bucket.acquire()
                 # Make API request to Gemini
-                response = requests.post(
+                response = self.session.post(
                     f"{self.gemini_api_url}?key={self.gemini_api_key}",
                     headers=self.gemini_headers,
                     json={
@@ -1461,46 +2304,45 @@ class LLMSentimentAnalyzer:
                         }],
                         "generationConfig": {
                             "temperature": 0.1,
-                            "maxOutputTokens": 2048
+                            "maxOutputTokens": max(1024, 40 * len(batch_comments)),
+                            "responseMimeType": "application/json",
+                            "responseSchema": _SENTIMENT_RESPONSE_SCHEMA
                         }
                     },
                     timeout=30
                 )
-                
+
                 if response.status_code == 200:
                     gemini_result = response.json()
                     if 'candidates' in gemini_result and len(gemini_result['candidates']) > 0:
                         response_text = gemini_result['candidates'][0]['content']['parts'][0]['text']
-                        batch_results = self._parse_gemini_response(response_text, batch_comments, batch_start)
-                        results.extend(batch_results)
-                    else:
-                        logger.warning(f"Unexpected Gemini response format for batch starting at {batch_start}")
-                        # Fallback for this batch
-                        for i, comment in enumerate(batch_comments):
-                            results.append(self._fallback_sentiment(comment, batch_start + i + 1))
-                else:
-                    logger.warning(f"Gemini API error for batch starting at {batch_start}: {response.status_code}")
-                    if response.status_code == 429:
-                        logger.info("Rate limit hit, waiting before retry...")
-                        time.sleep(2)
-                    
-                    # Fallback to VADER for this batch
-                    for i, comment in enumerate(batch_comments):
-                        results.append(self._fallback_sentiment(comment, batch_start + i + 1))
-                        
-                # Rate limiting - delay between batches
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error analyzing batch starting at {batch_start} with Gemini: {str(e)}")
-                # Fallback for this batch
-                for i, comment in enumerate(batch_comments):
-                    results.append(self._fallback_sentiment(comment, batch_start + i + 1))
-        
-        return self._process_llm_results(results)
+                        _gemini_cache.set(cache_key, response_text, GEMINI_CACHE_TTL)
+                        return self._parse_gemini_response(response_text, batch_comments, batch_start)
+                    logger.warning(f"Unexpected Gemini response format for batch starting at {batch_start}")
+                    break
+
+                if response.status_code == 429 and attempt < GEMINI_MAX_ATTEMPTS - 1:
+                    delay = 2 ** attempt + random.random()
+                    logger.info(f"Rate limit hit, retrying batch {batch_start} in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+
+                logger.warning(f"Gemini API error for batch starting at {batch_start}: {response.status_code}")
+                break
+
+        except Exception as e:
+            logger.error(f"Error analyzing batch starting at {batch_start} with Gemini: {str(e)}")
+
+        # Fallback to VADER for this batch
+        return [
+            self._fallback_sentiment(comment, batch_start + i + 1)
+            for i, comment in enumerate(batch_comments)
+        ]
     
     def _create_gemini_prompt(self, comments: List[str], batch_start: int) -> str:
         """Create a structured prompt for Gemini sentiment analysis"""
+        # List-buffer + join: appending to a list and joining once avoids
+        # quadratic string reallocation as batch sizes grow.
         prompt = """Analyze the sentiment of the following YouTube comments. For each comment, provide:
 1. Sentiment: positive, negative, or neutral
 2. Confidence: a decimal between 0 and 1
@@ -1514,61 +2356,56 @@ Respond in this exact JSON format:
 Comments to analyze:
 """
         
-        for i, comment in enumerate(comments):
-            comment_id = batch_start + i + 1
-            clean_comment = comment.replace('"', '\"').replace('\n', ' ').strip()
-            prompt += f"\ncomment_{comment_id}: \"{clean_comment}\""
-        
-        prompt += "\n\nProvide only the JSON array response, no additional text."
-        return prompt
+        parts = [prompt]
+        parts.extend(
+            f'\ncomment_{batch_start + i + 1}: "{comment.translate(_PROMPT_CLEAN).strip()}"'
+            for i, comment in enumerate(comments)
+        )
+        parts.append("\n\nProvide only the JSON array response, no additional text.")
+        return "".join(parts)
     
     def _parse_gemini_response(self, response_text: str, comments: List[str], batch_start: int) -> List[Dict[str, Any]]:
         """Parse Gemini's JSON response into our format"""
         results = []
         
         try:
-            # Extract JSON from response (sometimes Gemini adds extra text)
-            json_start = response_text.find('[')
-            json_end = response_text.rfind(']') + 1
-            
-            if json_start != -1 and json_end != -1:
-                json_str = response_text[json_start:json_end]
-                gemini_results = json.loads(json_str)
+            try:
+                # Schema-constrained responses are the bare JSON array
+                gemini_results = _json_loads(response_text)
+            except ValueError:
+                # Tolerate fenced JSON from unconstrained output
+                gemini_results = _json_loads(_FENCE_RE.sub('', response_text.strip()))
+
+            # Index once so each comment match is an O(1) lookup instead
+            # of a linear scan per comment over the batch results
+            by_id = {r.get('comment_id'): r for r in gemini_results}
+
+            for i, comment in enumerate(comments):
+                comment_id = batch_start + i + 1
+                gemini_result = by_id.get(f'comment_{comment_id}')
                 
-                for i, comment in enumerate(comments):
-                    comment_id = batch_start + i + 1
+                if gemini_result:
+                    sentiment = gemini_result.get('sentiment', 'neutral').lower()
+                    confidence = float(gemini_result.get('confidence', 0.5))
                     
-                    # Find matching result from Gemini
-                    gemini_result = None
-                    for result in gemini_results:
-                        if result.get('comment_id') == f'comment_{comment_id}':
-                            gemini_result = result
-                            break
+                    # Validate sentiment
+                    if sentiment not in ['positive', 'negative', 'neutral']:
+                        sentiment = 'neutral'
                     
-                    if gemini_result:
-                        sentiment = gemini_result.get('sentiment', 'neutral').lower()
-                        confidence = float(gemini_result.get('confidence', 0.5))
-                        
-                        # Validate sentiment
-                        if sentiment not in ['positive', 'negative', 'neutral']:
-                            sentiment = 'neutral'
-                        
-                        # Validate confidence
-                        if not (0 <= confidence <= 1):
-                            confidence = 0.5
-                        
-                        results.append({
-                            'comment_id': f'comment_{comment_id}',
-                            'comment_text': comment,
-                            'sentiment': sentiment,
-                            'confidence': round(confidence, 3),
-                            'source': 'gemini_api'
-                        })
-                    else:
-                        # Fallback if no matching result found
-                        results.append(self._fallback_sentiment(comment, comment_id))
-            else:
-                raise ValueError("No valid JSON found in response")
+                    # Validate confidence
+                    if not (0 <= confidence <= 1):
+                        confidence = 0.5
+                    
+                    results.append({
+                        'comment_id': f'comment_{comment_id}',
+                        'comment_text': comment,
+                        'sentiment': sentiment,
+                        'confidence': round(confidence, 3),
+                        'source': 'gemini_api'
+                    })
+                else:
+                    # Fallback if no matching result found
+                    results.append(self._fallback_sentiment(comment, comment_id))
                 
         except Exception as e:
             logger.error(f"Error parsing Gemini response: {str(e)}")
@@ -1582,9 +2419,12 @@ Comments to analyze:
     
     def _fallback_sentiment(self, comment: str, comment_id: int) -> Dict[str, Any]:
         """Fallback sentiment analysis using VADER"""
-        if SENTIMENT_AVAILABLE:
-            analyzer = SentimentIntensityAnalyzer()
-            scores = analyzer.polarity_scores(comment)
+        if self._vader is not None:
+            # Collapse pathological repeated-punctuation runs and cap the
+            # length so one adversarial comment cannot stall the batch.
+            scores = self._vader.polarity_scores(
+                _REPEAT_RUN_RE.sub(r'\1\1\1', comment)[:2000]
+            )
             
             # Convert VADER compound score to sentiment
             if scores['compound'] >= 0.05:
@@ -1610,34 +2450,52 @@ Comments to analyze:
                 'source': 'mock_fallback'
             }
     
-    def _process_llm_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Process LLM results and create comprehensive analysis"""
+    def _process_llm_results(self, results: List[Dict[str, Any]], include_csv: bool = False) -> Dict[str, Any]:
+        """Process LLM results and create comprehensive analysis
+
+        The CSV rendering of the full result set is only built when the
+        caller asks for it; the streaming endpoint serves it otherwise.
+        """
         if not results:
             return {"error": "No results to process"}
-        
-        # Count sentiments
-        sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
-        total_confidence = 0
-        
-        for result in results:
-            sentiment_counts[result['sentiment']] += 1
-            total_confidence += result['confidence']
-        
-        total_comments = len(results)
-        avg_confidence = total_confidence / total_comments if total_comments > 0 else 0
-        
+
+        # One pass into columnar arrays, then one compiled pass for the
+        # class counts, confidence buckets and per-class extremes.
+        batch = SentimentBatch.from_results(results)
+        total_comments = len(batch)
+        confidences = batch.confidences
+
+        (positive_count, negative_count, high_confidence, medium_confidence,
+         best_positive, best_negative) = _sentiment_stats(confidences, batch.codes)
+        neutral_count = total_comments - positive_count - negative_count
+        low_confidence = total_comments - high_confidence - medium_confidence
+        sentiment_counts = {
+            'positive': positive_count,
+            'neutral': neutral_count,
+            'negative': negative_count
+        }
+
+        avg_confidence = float(confidences.mean())
+
         # Calculate percentages
-        positive_pct = (sentiment_counts['positive'] / total_comments) * 100
-        neutral_pct = (sentiment_counts['neutral'] / total_comments) * 100
-        negative_pct = (sentiment_counts['negative'] / total_comments) * 100
+        positive_pct = (positive_count / total_comments) * 100
+        neutral_pct = (neutral_count / total_comments) * 100
+        negative_pct = (negative_count / total_comments) * 100
         
         # Calculate overall rating (1-5 scale)
         overall_rating = 1 + (positive_pct * 0.04) + (neutral_pct * 0.02)
         
-        # Find most confident predictions
-        sorted_results = sorted(results, key=lambda x: x['confidence'], reverse=True)
-        
-        return {
+        most_positive = batch.row(best_positive) if best_positive >= 0 else None
+        most_negative = batch.row(best_negative) if best_negative >= 0 else None
+
+        # Only the 20 most confident predictions are shown; argpartition
+        # selects them in O(n) before the tiny final sort
+        k = min(20, total_comments)
+        top_idx = np.argpartition(confidences, total_comments - k)[-k:]
+        top_idx = top_idx[np.argsort(confidences[top_idx])[::-1]]
+        top_results = [batch.row(int(i)) for i in top_idx]
+        
+        analysis = {
             'overview': {
                 'positive_percentage': round(positive_pct, 1),
                 'neutral_percentage': round(neutral_pct, 1),
@@ -1646,33 +2504,38 @@ Comments to analyze:
                 'total_comments': total_comments,
                 'average_confidence': round(avg_confidence, 3)
             },
-            'detailed_sentiments': results[:20],  # Show top 20 for frontend
+            'detailed_sentiments': top_results,  # Show top 20 for frontend
             'summary': {
-                'most_positive': max([r for r in results if r['sentiment'] == 'positive'], 
-                                   key=lambda x: x['confidence'], default=None),
-                'most_negative': max([r for r in results if r['sentiment'] == 'negative'], 
-                                   key=lambda x: x['confidence'], default=None),
-                'dominant_sentiment': max(sentiment_counts.items(), key=lambda x: x[1])[0],
+                'most_positive': most_positive,
+                'most_negative': most_negative,
+                'dominant_sentiment': max(sentiment_counts.items(), key=operator.itemgetter(1))[0],
                 'confidence_distribution': {
-                    'high_confidence': len([r for r in results if r['confidence'] > 0.8]),
-                    'medium_confidence': len([r for r in results if 0.5 <= r['confidence'] <= 0.8]),
-                    'low_confidence': len([r for r in results if r['confidence'] < 0.5])
+                    'high_confidence': high_confidence,
+                    'medium_confidence': medium_confidence,
+                    'low_confidence': low_confidence
                 }
             },
-            'csv_results': self.create_results_csv(results),
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _now_iso()
         }
+        if include_csv:
+            analysis['csv_results'] = self.create_results_csv(results)
+        return analysis
     
-    def create_results_csv(self, results: List[Dict[str, Any]]) -> str:
-        """Create CSV string with sentiment analysis results"""
-        output = io.StringIO()
-        writer = csv.writer(output)
+    def iter_results_csv(self, results: List[Dict[str, Any]]):
+        """Yield sentiment results as CSV, one line at a time
+
+        Streaming the rows keeps a large result set out of memory
+        instead of building a multi-megabyte string for the response.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
         
-        # Write header
         writer.writerow(['comment_id', 'comment_text', 'sentiment', 'confidence', 'source'])
+        yield buffer.getvalue()
         
-        # Write results
         for result in results:
+            buffer.seek(0)
+            buffer.truncate()
             writer.writerow([
                 result['comment_id'],
                 result['comment_text'][:100] + '...' if len(result['comment_text']) > 100 else result['comment_text'],
@@ -1680,10 +2543,11 @@ Comments to analyze:
                 result['confidence'],
                 result['source']
             ])
-        
-        csv_content = output.getvalue()
-        output.close()
-        return csv_content
+            yield buffer.getvalue()
+
+    def create_results_csv(self, results: List[Dict[str, Any]]) -> str:
+        """Create CSV string with sentiment analysis results"""
+        return "".join(self.iter_results_csv(results))
 
 class GeminiPerformanceAnalyzer:
     """AI-powered performance analysis using Google Gemini API"""
@@ -1695,6 +2559,7 @@ class GeminiPerformanceAnalyzer:
         self.gemini_headers = {
             "Content-Type": "application/json"
         }
+        self.session = _SESSION
         logger.info("Gemini Performance Analyzer initialized")
     
     def analyze_performance_with_gemini(self, video_data: Dict[str, Any], channel_data: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -1709,9 +2574,14 @@ class GeminiPerformanceAnalyzer:
             
             # Create comprehensive performance analysis prompt
             prompt = self._create_performance_analysis_prompt(video_data, channel_data)
-            
+
+            cache_key = _gemini_cache_key(self.gemini_api_url, 0.3, prompt)
+            cached_text = _gemini_cache.get(cache_key)
+            if cached_text is not None:
+                return self._parse_performance_analysis(cached_text, video_data)
+
             # Make API request to Gemini
-            response = requests.post(
+            response = self.session.post(
                 f"{self.gemini_api_url}?key={self.gemini_api_key}",
                 headers=self.gemini_headers,
                 json={
@@ -1720,7 +2590,8 @@ class GeminiPerformanceAnalyzer:
                     }],
                     "generationConfig": {
                         "temperature": 0.3,
-                        "maxOutputTokens": 3000
+                        "maxOutputTokens": 3000,
+                        "responseMimeType": "application/json"
                     }
                 },
                 timeout=30
@@ -1733,7 +2604,12 @@ class GeminiPerformanceAnalyzer:
                 if 'candidates' in gemini_result and len(gemini_result['candidates']) > 0:
                     response_text = gemini_result['candidates'][0]['content']['parts'][0]['text']
                     logger.info("Successfully received Gemini AI analysis response")
-                    return self._parse_performance_analysis(response_text, video_data)
+                    analysis = self._parse_performance_analysis(response_text, video_data)
+                    # Only cache text that actually parsed; caching an
+                    # unparseable body would pin the fallback for an hour
+                    if analysis.get('analysis_method') == 'gemini_ai':
+                        _gemini_cache.set(cache_key, response_text, GEMINI_CACHE_TTL)
+                    return analysis
                 else:
                     logger.warning("Unexpected Gemini response format for performance analysis")
                     return self._fallback_performance_analysis(video_data)
@@ -1821,40 +2697,47 @@ Provide only the JSON response, no additional text."""
     def _parse_performance_analysis(self, response_text: str, video_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Gemini's performance analysis response"""
         try:
-            # Extract JSON from response
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            
-            if json_start != -1 and json_end != -1:
-                json_str = response_text[json_start:json_end]
-                gemini_analysis = json.loads(json_str)
-                
-                # Validate and structure the response
-                analysis_result = {
-                    'overall_score': gemini_analysis.get('overall_score', 75),
-                    'grade': gemini_analysis.get('grade', 'B'),
-                    'scores': {
-                        'views': gemini_analysis.get('scores', {}).get('views', 70),
-                        'engagement': gemini_analysis.get('scores', {}).get('engagement', 75),
-                        'watch_time': gemini_analysis.get('scores', {}).get('watch_time', 70),
-                        'ctr': gemini_analysis.get('scores', {}).get('ctr', 75)
-                    },
-                    'analysis': {
-                        'strengths': gemini_analysis.get('analysis', {}).get('strengths', []),
-                        'weaknesses': gemini_analysis.get('analysis', {}).get('weaknesses', []),
-                        'benchmark_comparison': gemini_analysis.get('analysis', {}).get('benchmark_comparison', 'Analysis pending')
-                    },
-                    'recommendations': gemini_analysis.get('recommendations', []),
-                    'growth_potential': gemini_analysis.get('growth_potential', 'medium'),
-                    'key_insights': gemini_analysis.get('key_insights', []),
-                    'analysis_method': 'gemini_ai',
-                    'last_updated': datetime.now().isoformat()
-                }
-                
-                return analysis_result
-            else:
-                raise ValueError("No valid JSON found in Gemini response")
-                
+            try:
+                # Bare JSON object in the common case
+                gemini_analysis = _json_loads(response_text)
+            except ValueError:
+                # Tolerate fenced JSON, then prose-wrapped JSON as a
+                # last resort — the mime-type hint is not a hard schema,
+                # so the model can still narrate around the object
+                stripped = _FENCE_RE.sub('', response_text.strip())
+                try:
+                    gemini_analysis = _json_loads(stripped)
+                except ValueError:
+                    json_start = stripped.find('{')
+                    json_end = stripped.rfind('}') + 1
+                    if json_start == -1 or json_end == 0:
+                        raise ValueError("No valid JSON found in Gemini response")
+                    gemini_analysis = _json_loads(stripped[json_start:json_end])
+
+            # Validate and structure the response
+            analysis_result = {
+                'overall_score': gemini_analysis.get('overall_score', 75),
+                'grade': gemini_analysis.get('grade', 'B'),
+                'scores': {
+                    'views': gemini_analysis.get('scores', {}).get('views', 70),
+                    'engagement': gemini_analysis.get('scores', {}).get('engagement', 75),
+                    'watch_time': gemini_analysis.get('scores', {}).get('watch_time', 70),
+                    'ctr': gemini_analysis.get('scores', {}).get('ctr', 75)
+                },
+                'analysis': {
+                    'strengths': gemini_analysis.get('analysis', {}).get('strengths', []),
+                    'weaknesses': gemini_analysis.get('analysis', {}).get('weaknesses', []),
+                    'benchmark_comparison': gemini_analysis.get('analysis', {}).get('benchmark_comparison', 'Analysis pending')
+                },
+                'recommendations': gemini_analysis.get('recommendations', []),
+                'growth_potential': gemini_analysis.get('growth_potential', 'medium'),
+                'key_insights': gemini_analysis.get('key_insights', []),
+                'analysis_method': 'gemini_ai',
+                'last_updated': _now_iso()
+            }
+
+            return analysis_result
+
         except Exception as e:
             logger.error(f"Error parsing Gemini performance analysis: {str(e)}")
             logger.debug(f"Response text: {response_text}")
@@ -1912,7 +2795,7 @@ Provide only the JSON response, no additional text."""
             'growth_potential': 'medium',
             'key_insights': ['Basic performance metrics calculated'],
             'analysis_method': 'fallback',
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _now_iso()
         }
 
 # Initialize YouTube API and Analytics Engine instances AFTER all classes are defined
@@ -1922,4 +2805,7 @@ llm_sentiment_analyzer = LLMSentimentAnalyzer()
 gemini_performance_analyzer = GeminiPerformanceAnalyzer()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    # Development entrypoint only; production runs behind gunicorn (see
+    # gunicorn_conf.py). DEBUG follows config.py, so FLASK_ENV decides
+    # whether the reloader and debugger are enabled.
+    app.run(debug=app.config['DEBUG'], host='0.0.0.0', port=5000) 
\ No newline at end of file
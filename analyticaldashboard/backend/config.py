@@ -32,7 +32,7 @@ class Config:
     DATABASE_URL = os.environ.get('DATABASE_URL')
     
     # Cache Configuration
-    CACHE_TYPE = 'simple'
+    CACHE_TYPE = 'SimpleCache'
     CACHE_DEFAULT_TIMEOUT = 300
     
     # Logging Configuration
@@ -0,0 +1,16 @@
+"""Gunicorn configuration for the backend
+
+Threaded workers keep slow Gemini calls (up to 30s) from stalling the
+fast endpoints: while one thread waits on upstream I/O the other
+threads in the worker keep serving requests, instead of the whole
+process blocking like the single-threaded dev server.
+
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+
+bind = '0.0.0.0:5000'
+workers = 2
+threads = 8
+worker_class = 'gthread'
+timeout = 60
+keepalive = 5
@@ -1,18 +1,58 @@
+import functools
 import logging
+import os
+
+# Optional dependency: resolved once at import so the per-call path only
+# tests a module-level flag.
+try:
+    from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+except ImportError:
+    YouTubeTranscriptApi = None
+
+# Transcripts are immutable per video, so successful fetches are cached
+# both in-process and on disk; a repeat request costs a dict lookup or a
+# small file read instead of a ~1s network fetch.
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'transcripts')
+
+@functools.lru_cache(maxsize=512)
+def _fetch_transcript(video_id):
+    """Fetch one transcript, reading through the disk cache.
+
+    Raises when the transcript cannot be fetched; lru_cache only stores
+    returns, so failures are retried on the next request instead of
+    being pinned until restart.
+    """
+    cache_path = os.path.join(_CACHE_DIR, f"{video_id}.txt")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as cached:
+            return cached.read()
+    except OSError:
+        pass
+
+    transcript = YouTubeTranscriptApi.get_transcript(video_id)
+    transcript_text = " ".join([entry['text'] for entry in transcript])
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as cached:
+            cached.write(transcript_text)
+    except OSError as e:
+        logging.warning(f"Could not persist transcript cache: {e}")
+
+    return transcript_text
 
 def get_video_transcript(video_id):
     """
     Fetch transcript for a given YouTube video ID using youtube_transcript_api.
     Returns transcript as a string, or a fallback message if not available.
+    Successful results are cached in-process and persisted under cache/transcripts/.
     """
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-        transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        transcript_text = " ".join([entry['text'] for entry in transcript])
-        return transcript_text
-    except ImportError:
+    if YouTubeTranscriptApi is None:
         logging.warning("youtube_transcript_api not installed. Transcript unavailable.")
         return "Transcript unavailable (missing dependency)."
+
+    try:
+        return _fetch_transcript(video_id)
     except (TranscriptsDisabled, NoTranscriptFound):
         return "Transcript unavailable for this video."
     except Exception as e:
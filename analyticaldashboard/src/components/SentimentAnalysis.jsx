@@ -282,7 +282,7 @@ const SentimentAnalysis = () => {
       </div>
 
       {/* CSV Download Link */}
-      {sentimentData?.csv_results && (
+      {sentimentData && !error && (
         <div className="mt-6 p-4 bg-gray-50 rounded-xl">
           <div className="flex items-center gap-2 mb-2">
             <Download className="h-5 w-5 text-gray-600" />
@@ -291,22 +291,13 @@ const SentimentAnalysis = () => {
           <p className="text-sm text-gray-600 mb-3">
             Download the complete sentiment analysis results as CSV
           </p>
-          <button
-            onClick={() => {
-              const blob = new Blob([sentimentData.csv_results], { type: 'text/csv' });
-              const url = window.URL.createObjectURL(blob);
-              const a = document.createElement('a');
-              a.href = url;
-              a.download = `sentiment_analysis_${sentimentData.video_info?.video_id || 'results'}.csv`;
-              document.body.appendChild(a);
-              a.click();
-              window.URL.revokeObjectURL(url);
-              document.body.removeChild(a);
-            }}
-            className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors text-sm"
+          <a
+            href={`${API_BASE_URL}/sentiment-analysis/csv`}
+            download={`sentiment_analysis_${sentimentData.video_info?.video_id || 'results'}.csv`}
+            className="inline-block px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors text-sm"
           >
             Download CSV Results
-          </button>
+          </a>
         </div>
       )}
 
@@ -5,7 +5,7 @@ echo
 
 echo "Starting Python Backend..."
 cd backend
-python app.py &
+gunicorn -c gunicorn_conf.py app:app &
 BACKEND_PID=$!
 cd ..
 